@@ -5,6 +5,17 @@ Parser de argumentos de línea de comandos para el orquestador de backup
 import argparse
 
 
+def _positive_int(value: str) -> int:
+    """Tipo de argparse para enteros mayores que cero"""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"se esperaba un entero: '{value}'")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"debe ser mayor que 0: {number}")
+    return number
+
+
 def create_cli_parser():
     """
     Crea el parser de argumentos de línea de comandos
@@ -17,27 +28,72 @@ Ejemplos de uso:
   %(prog)s                           # Crear backup con timestamp
   %(prog)s --name mi_backup          # Crear backup con nombre personalizado
   %(prog)s --container mi_db         # Backup desde contenedor diferente
+  %(prog)s --container db1 db2       # Backups de varios contenedores en paralelo
   %(prog)s --dir /ruta/a/backups     # Usar directorio diferente
   %(prog)s --quiet                   # Ejecutar sin indicadores de progreso
   %(prog)s --list                    # Listar backups existentes
+  %(prog)s --list --limit 10         # Listar solo los 10 backups más recientes
   %(prog)s --name test --force       # Sobrescribir backup existente
   %(prog)s --no-color                # Deshabilitar salida coloreada
+  %(prog)s --db-host 127.0.0.1       # pg_dump local contra el puerto publicado
+  %(prog)s --format custom           # Formato de archivo (.dump) para pg_restore -j
+  %(prog)s --no-compress             # Guardar SQL plano sin comprimir (.sql)
+  %(prog)s --jobs 4                  # Volcado en paralelo (formato directorio, .tar)
         """
     )
     
     parser.add_argument(
         '--name', '-n',
         type=str,
-        help='Nombre personalizado para el archivo de backup (sin extensión .sql)'
+        help='Nombre personalizado para el archivo de backup (sin extensión)'
     )
     
     parser.add_argument(
         '--container', '-c',
         type=str,
-        default='pc_db',
-        help='Nombre del contenedor Docker (predeterminado: pc_db)'
+        nargs='+',
+        default=['pc_db'],
+        help='Nombre del contenedor Docker; con varios se respaldan en paralelo '
+             '(predeterminado: pc_db)'
     )
-    
+
+    parser.add_argument(
+        '--db-host',
+        type=str,
+        help='Host de PostgreSQL para ejecutar pg_dump desde el host en lugar de '
+             'docker exec (requiere pg_dump instalado localmente)'
+    )
+
+    parser.add_argument(
+        '--db-port',
+        type=int,
+        default=5432,
+        help='Puerto de PostgreSQL usado junto con --db-host (predeterminado: 5432)'
+    )
+
+    parser.add_argument(
+        '--format',
+        choices=['plain', 'custom', 'directory'],
+        default='plain',
+        help='Formato de salida de pg_dump: SQL plano comprimido (.sql.gz), '
+             'formato de archivo personalizado (.dump) o directorio empaquetado '
+             'en tar (.tar) (predeterminado: plain)'
+    )
+
+    parser.add_argument(
+        '--jobs', '-j',
+        type=_positive_int,
+        default=1,
+        help='Número de workers de pg_dump; con más de 1 se usa el formato '
+             'directorio, incompatible con --format custom (predeterminado: 1)'
+    )
+
+    parser.add_argument(
+        '--no-compress',
+        action='store_true',
+        help='Deshabilitar la compresión de pg_dump'
+    )
+
     parser.add_argument(
         '--dir', '-d',
         type=str,
@@ -69,6 +125,12 @@ Ejemplos de uso:
         help='Listar archivos de backup existentes y salir'
     )
     
+    parser.add_argument(
+        '--limit',
+        type=_positive_int,
+        help='Con --list, mostrar solo los N backups más recientes'
+    )
+
     parser.add_argument(
         '--no-color',
         action='store_true',
@@ -78,6 +140,16 @@ Ejemplos de uso:
     return parser
 
 
+def validate_cli_args(parser: argparse.ArgumentParser, args):
+    """
+    Rechaza combinaciones de argumentos incompatibles con parser.error
+    """
+    if args.limit is not None and not args.list:
+        parser.error("--limit solo puede usarse junto con --list")
+    if args.jobs > 1 and args.format == 'custom':
+        parser.error("--jobs mayor que 1 requiere el formato directorio, no --format custom")
+
+
 class CLIConfig:
     """
     Configuración derivada de los argumentos de línea de comandos
@@ -85,12 +157,21 @@ class CLIConfig:
     
     def __init__(self, args):
         self.name = args.name
-        self.container = args.container
+        # Acepta un nombre o una lista; sin duplicados y conservando el orden indicado
+        containers = [args.container] if isinstance(args.container, str) else args.container
+        self.containers = list(dict.fromkeys(containers))
+        self.container = self.containers[0]
+        self.db_host = args.db_host
+        self.db_port = args.db_port
+        self.dump_format = args.format
+        self.compress = not args.no_compress
+        self.jobs = args.jobs
         self.backup_dir = args.dir
         self.verbose = args.verbose
         self.quiet = args.quiet
         self.force = args.force
         self.list = args.list
+        self.limit = args.limit
         self.no_color = args.no_color
         
         # Configuraciones derivadas
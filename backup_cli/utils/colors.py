@@ -29,12 +29,20 @@ class Colors:
     BRIGHT_MAGENTA = '\033[95m'
     BRIGHT_CYAN = '\033[96m'
     
+    # Atributos que contienen códigos ANSI
+    _COLOR_ATTRS = (
+        'RESET', 'BOLD', 'RED', 'GREEN', 'YELLOW', 'BLUE', 'MAGENTA', 'CYAN', 'WHITE',
+        'BRIGHT_RED', 'BRIGHT_GREEN', 'BRIGHT_YELLOW', 'BRIGHT_BLUE', 'BRIGHT_MAGENTA',
+        'BRIGHT_CYAN'
+    )
+
     @classmethod
     def disable(cls):
         """Deshabilita todos los colores"""
-        for attr in dir(cls):
-            if not attr.startswith('_') and attr != 'disable':
-                setattr(cls, attr, '')
+        for attr in cls._COLOR_ATTRS:
+            setattr(cls, attr, '')
+        # Las plantillas con color se construyeron con los códigos anteriores
+        _COLOR_TEMPLATES.update(_build_templates(use_colors=True))
 
 
 def should_use_colors(no_color_flag: bool = False) -> bool:
@@ -44,21 +52,50 @@ def should_use_colors(no_color_flag: bool = False) -> bool:
     return not no_color_flag and sys.stdout.isatty()
 
 
+# Atributo de color asociado a cada nivel de mensaje
+_LEVEL_COLORS = {
+    'INFO': 'BLUE',
+    'SUCCESS': 'BRIGHT_GREEN',
+    'WARNING': 'BRIGHT_YELLOW',
+    'ERROR': 'BRIGHT_RED',
+    'FAILED': 'BRIGHT_RED',
+    'CANCELLED': 'YELLOW'
+}
+
+
+def level_prefix(level: str, use_colors: bool = True) -> str:
+    """
+    Construye el prefijo [NIVEL] de un mensaje, con color si corresponde
+    """
+    if use_colors:
+        color = getattr(Colors, _LEVEL_COLORS.get(level, 'WHITE'))
+        return f"{color}[{level}]{Colors.RESET}"
+    return f"[{level}]"
+
+
+def build_level_prefixes(use_colors: bool = True) -> dict[str, str]:
+    """
+    Precalcula los prefijos de todos los niveles conocidos
+    """
+    return {level: level_prefix(level, use_colors) for level in _LEVEL_COLORS}
+
+
+def _build_templates(use_colors: bool) -> dict[str, str]:
+    """Plantillas '%s' con el prefijo de cada nivel ya aplicado"""
+    return {level: f"{prefix} %s" for level, prefix in build_level_prefixes(use_colors).items()}
+
+
+# Plantillas por nivel calculadas una sola vez al importar el módulo
+_COLOR_TEMPLATES = _build_templates(use_colors=True)
+_PLAIN_TEMPLATES = _build_templates(use_colors=False)
+
+
 def print_colored_message(level: str, message: str, use_colors: bool = True):
     """
     Imprime un mensaje con color basado en el nivel
     """
-    color_map = {
-        'INFO': Colors.BLUE,
-        'SUCCESS': Colors.BRIGHT_GREEN,
-        'WARNING': Colors.BRIGHT_YELLOW,
-        'ERROR': Colors.BRIGHT_RED,
-        'FAILED': Colors.BRIGHT_RED,
-        'CANCELLED': Colors.YELLOW
-    }
-    
-    if use_colors:
-        color = color_map.get(level, Colors.WHITE)
-        print(f"{color}[{level}]{Colors.RESET} {message}")
+    template = (_COLOR_TEMPLATES if use_colors else _PLAIN_TEMPLATES).get(level)
+    if template is None:
+        print(f"{level_prefix(level, use_colors)} {message}")
     else:
-        print(f"[{level}] {message}") 
\ No newline at end of file
+        print(template % message)
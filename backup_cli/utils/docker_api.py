@@ -0,0 +1,123 @@
+"""
+Cliente mínimo de la API de Docker Engine sobre su socket UNIX
+"""
+
+import http.client
+import json
+import os
+import socket
+from urllib.parse import quote
+
+DOCKER_SOCKET = "/var/run/docker.sock"
+
+
+class DockerAPIUnavailable(Exception):
+    """
+    El daemon de Docker no es accesible a través del socket
+    """
+
+
+def _current_context() -> str:
+    """Contexto de Docker activo según DOCKER_CONTEXT o la configuración del CLI"""
+    context = os.environ.get("DOCKER_CONTEXT")
+    if context:
+        return context
+    config_dir = os.environ.get("DOCKER_CONFIG") or os.path.expanduser("~/.docker")
+    try:
+        with open(os.path.join(config_dir, "config.json"), encoding="utf-8") as f:
+            return json.load(f).get("currentContext") or "default"
+    except (OSError, ValueError, AttributeError):
+        return "default"
+
+
+def resolve_docker_socket() -> str:
+    """
+    Devuelve el socket del daemon que usaría el CLI de docker.
+    Lanza DockerAPIUnavailable si el daemon no es accesible por un socket UNIX
+    conocido (DOCKER_HOST remoto o un contexto distinto del predeterminado)
+    """
+    docker_host = os.environ.get("DOCKER_HOST")
+    if docker_host:
+        if docker_host.startswith("unix://"):
+            return docker_host[len("unix://"):]
+        raise DockerAPIUnavailable(f"DOCKER_HOST no es un socket UNIX: {docker_host}")
+    context = _current_context()
+    if context != "default":
+        raise DockerAPIUnavailable(f"Contexto de Docker '{context}' no soportado por la API")
+    return DOCKER_SOCKET
+
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    """
+    Conexión HTTP que usa un socket UNIX en lugar de TCP
+    """
+
+    def __init__(self, socket_path: str, timeout: float):
+        super().__init__("localhost", timeout=timeout)
+        self.socket_path = socket_path
+
+    def connect(self):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        try:
+            sock.connect(self.socket_path)
+        except OSError:
+            sock.close()
+            raise
+        self.sock = sock
+
+
+class DockerEngineClient:
+    """
+    Cliente que reutiliza una única conexión keep-alive con el daemon de Docker
+    """
+
+    def __init__(self, socket_path: str = None, timeout: float = 10):
+        # Sin socket explícito se resuelve como el CLI: DOCKER_HOST y contexto activo
+        self.socket_path = socket_path
+        self.timeout = timeout
+        self._conn = None
+
+    def _get(self, path: str) -> tuple[int, bytes]:
+        """Realiza una petición GET y devuelve el código de estado y el cuerpo"""
+        if not hasattr(socket, 'AF_UNIX'):
+            raise DockerAPIUnavailable("Sockets UNIX no soportados en esta plataforma")
+        if self._conn is None:
+            socket_path = self.socket_path or resolve_docker_socket()
+            self._conn = _UnixHTTPConnection(socket_path, self.timeout)
+
+        try:
+            try:
+                return self._request(path)
+            except (BrokenPipeError, ConnectionResetError):
+                # El daemon cerró la conexión ociosa: reconectar una vez
+                self._conn.close()
+                return self._request(path)
+        except (OSError, http.client.HTTPException) as e:
+            self._conn.close()
+            raise DockerAPIUnavailable(str(e)) from e
+
+    def _request(self, path: str) -> tuple[int, bytes]:
+        self._conn.request("GET", path)
+        response = self._conn.getresponse()
+        return response.status, response.read()
+
+    def container_running(self, name: str) -> bool:
+        """
+        Indica si el contenedor existe y está en ejecución
+        """
+        status, body = self._get(f"/containers/{quote(name, safe='')}/json")
+        if status == 404:
+            return False
+        if status != 200:
+            raise DockerAPIUnavailable(f"Respuesta inesperada del daemon: HTTP {status}")
+        try:
+            return bool(json.loads(body)["State"]["Running"])
+        except (ValueError, KeyError, TypeError) as e:
+            raise DockerAPIUnavailable(f"Respuesta inválida del daemon: {e}") from e
+
+    def close(self):
+        """Cierra la conexión con el daemon si está abierta"""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
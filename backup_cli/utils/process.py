@@ -0,0 +1,78 @@
+"""
+Utilidades para la ejecución y espera de subprocesos
+"""
+
+import os
+import selectors
+import subprocess
+import time
+
+
+def _kill_and_raise(proc: subprocess.Popen, timeout: float):
+    """Termina el proceso y lanza TimeoutExpired como lo haría subprocess.run"""
+    proc.kill()
+    proc.wait()
+    raise subprocess.TimeoutExpired(proc.args, timeout)
+
+
+def _communicate(proc: subprocess.Popen, timeout: float) -> bytes:
+    """Espera al proceso con communicate() y devuelve su stderr"""
+    try:
+        _, stderr = proc.communicate(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        _kill_and_raise(proc, timeout)
+    return stderr or b""
+
+
+def wait_for_process(proc: subprocess.Popen, timeout: float,
+                     on_tick=None, tick_interval: float = 0.25) -> bytes:
+    """
+    Espera a que el proceso termine drenando su stderr y lo devuelve en bytes.
+
+    En Linux registra un pidfd en un selector para despertar exactamente cuando
+    el proceso finaliza, sin polling; en otras plataformas, o si el kernel no
+    permite pidfd_open, usa communicate().
+    Si se indica on_tick, se invoca al menos cada tick_interval segundos
+    mientras el proceso sigue en ejecución: la espera vuelve a despertar
+    periódicamente, así que conviene un intervalo amplio y omitir on_tick
+    cuando no hay progreso que mostrar.
+    """
+    if not hasattr(os, 'pidfd_open') or proc.stderr is None:
+        return _communicate(proc, timeout)
+    try:
+        pidfd = os.pidfd_open(proc.pid)
+    except OSError:
+        # Kernel anterior a 5.3, gVisor o seccomp sin pidfd_open
+        return _communicate(proc, timeout)
+
+    deadline = time.monotonic() + timeout
+    chunks = []
+    try:
+        with selectors.DefaultSelector() as selector:
+            selector.register(pidfd, selectors.EVENT_READ, 'exit')
+            selector.register(proc.stderr, selectors.EVENT_READ, 'stderr')
+            exited = False
+            while not exited:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    _kill_and_raise(proc, timeout)
+                wait = remaining if on_tick is None else min(remaining, tick_interval)
+                for key, _ in selector.select(wait):
+                    if key.data == 'exit':
+                        exited = True
+                    else:
+                        data = os.read(key.fd, 65536)
+                        if data:
+                            chunks.append(data)
+                        else:
+                            selector.unregister(key.fileobj)
+                if on_tick is not None and not exited:
+                    on_tick()
+    finally:
+        os.close(pidfd)
+
+    # El proceso ya terminó: leer lo que quede en el pipe hasta EOF
+    chunks.append(proc.stderr.read())
+    proc.stderr.close()
+    proc.wait()
+    return b"".join(chunks)
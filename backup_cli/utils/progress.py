@@ -49,4 +49,26 @@ class ProgressIndicator:
         if self.active:
             for i in range(steps):
                 time.sleep(duration / steps)
-                self.update(".") 
\ No newline at end of file
+                self.update(".")
+
+
+class NullProgressIndicator(ProgressIndicator):
+    """
+    Indicador de progreso sin salida, usado cuando el progreso está deshabilitado
+    """
+
+    def start(self):
+        """No muestra nada"""
+
+    def update(self, status: str = "."):
+        """No muestra nada"""
+
+    def complete(self, success: bool = True):
+        """No muestra nada"""
+
+    def simulate_work(self, duration: float = 0.9, steps: int = 3):
+        """No realiza pausas"""
+
+
+# Instancia compartida: el indicador nulo no tiene estado que cambie
+NULL_PROGRESS = NullProgressIndicator("")
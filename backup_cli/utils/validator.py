@@ -2,8 +2,7 @@
 Utilidades para validación de nombres de backup
 """
 
-import re
-from datetime import datetime
+import time
 from pathlib import Path
 
 
@@ -13,18 +12,22 @@ class BackupNameValidator:
     """
     
     # Nombres reservados del sistema
-    RESERVED_NAMES = {
+    RESERVED_NAMES = frozenset({
         'CON', 'PRN', 'AUX', 'NUL', 'COM1', 'COM2', 'COM3', 'COM4', 
         'COM5', 'COM6', 'COM7', 'COM8', 'COM9', 'LPT1', 'LPT2', 
         'LPT3', 'LPT4', 'LPT5', 'LPT6', 'LPT7', 'LPT8', 'LPT9'
-    }
+    })
     
     # Caracteres inválidos para nombres de archivo
     INVALID_CHARS_PATTERN = r'[<>:"/\\|?*]'
+    INVALID_CHARS = frozenset('<>:"/\\|?*')
     
     # Longitud máxima del nombre
     MAX_NAME_LENGTH = 200
 
+    # Formato del timestamp usado en los nombres generados
+    TIMESTAMP_FORMAT = "%Y%m%d_%H%M%S"
+
     @classmethod
     def validate_backup_name(cls, name: str) -> tuple[bool, str]:
         """
@@ -34,7 +37,7 @@ class BackupNameValidator:
             return False, "El nombre del backup no puede estar vacío"
             
         # Verificar caracteres inválidos
-        if re.search(cls.INVALID_CHARS_PATTERN, name):
+        if not cls.INVALID_CHARS.isdisjoint(name):
             return False, f"El nombre contiene caracteres inválidos: {cls.INVALID_CHARS_PATTERN}"
             
         # Verificar longitud
@@ -49,7 +52,7 @@ class BackupNameValidator:
 
     @classmethod
     def resolve_backup_filename(cls, backup_dir: Path, custom_name: str = None, 
-                              force_overwrite: bool = False) -> tuple[str, bool]:
+                              force_overwrite: bool = False, extension: str = ".sql") -> tuple[str, bool]:
         """
         Resuelve el nombre final del backup, manejando conflictos si es necesario
         """
@@ -58,29 +61,40 @@ class BackupNameValidator:
             if not is_valid:
                 raise ValueError(f"Nombre de backup inválido: {message}")
                 
-            backup_filename = f"{custom_name}.sql"
+            backup_filename = f"{custom_name}{extension}"
             backup_path = backup_dir / backup_filename
             
-            # Verificar si el archivo existe
-            if backup_path.exists() and not force_overwrite:
+            # Verificar si el archivo existe (innecesario si se va a sobrescribir)
+            if not force_overwrite and backup_path.exists():
                 # Generar nombre alternativo con timestamp
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                backup_filename = f"{custom_name}_{timestamp}.sql"
+                timestamp = backup_timestamp()
+                backup_filename = f"{custom_name}_{timestamp}{extension}"
                 return backup_filename, True  # True indica que el nombre fue modificado
             else:
                 return backup_filename, False  # False indica que se usó el nombre original
         else:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            backup_filename = f"backup_{timestamp}.sql"
+            timestamp = backup_timestamp()
+            backup_filename = f"backup_{timestamp}{extension}"
             return backup_filename, False
 
 
+def backup_timestamp(now: time.struct_time = None) -> str:
+    """
+    Devuelve la hora local con el formato TIMESTAMP_FORMAT (%Y%m%d_%H%M%S).
+    Se arma desde los campos de time.localtime sin interpretar un formato
+    """
+    t = now or time.localtime()
+    return f"{t.tm_year:04d}{t.tm_mon:02d}{t.tm_mday:02d}_{t.tm_hour:02d}{t.tm_min:02d}{t.tm_sec:02d}"
+
+
+# Unidades de tamaño, cada una 2**10 veces mayor que la anterior
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+
+
 def format_file_size(size_bytes: int) -> str:
     """
     Formatea el tamaño del archivo en unidades legibles
     """
-    for unit in ['B', 'KB', 'MB', 'GB']:
-        if size_bytes < 1024.0:
-            return f"{size_bytes:.1f} {unit}"
-        size_bytes /= 1024.0
-    return f"{size_bytes:.1f} TB" 
\ No newline at end of file
+    # El número de bits indica directamente la potencia de 1024 aplicable
+    index = max(0, min((size_bytes.bit_length() - 1) // 10, len(_SIZE_UNITS) - 1))
+    return f"{size_bytes / (1 << (10 * index)):.1f} {_SIZE_UNITS[index]}"
\ No newline at end of file
@@ -1,18 +1,60 @@
 #!/usr/bin/env python3
 
+import atexit
 import os
+import shlex
+import shutil
 import subprocess
 import logging
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
 # Importar módulos separados
-from backup_cli.utils.colors import Colors, should_use_colors, print_colored_message
-from backup_cli.utils.progress import ProgressIndicator
-from backup_cli.utils.validator import BackupNameValidator, format_file_size
-from backup_cli.cli.parser import create_cli_parser, CLIConfig
+from backup_cli.utils.colors import (
+    Colors, should_use_colors, print_colored_message, level_prefix, build_level_prefixes
+)
+from backup_cli.utils.progress import ProgressIndicator, NULL_PROGRESS
+from backup_cli.utils.process import wait_for_process
+from backup_cli.utils.validator import BackupNameValidator, backup_timestamp, format_file_size
+from backup_cli.cli.parser import create_cli_parser, validate_cli_args, CLIConfig
+
+
+# Formato compartido por todos los handlers de archivo del orquestador
+_LOG_FORMATTER = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+
+# Escritura de logs en segundo plano por archivo: (handler de cola, listener)
+_LOG_LISTENERS = {}
+# Los backups concurrentes configuran el logging desde varios hilos a la vez
+_LOG_LOCK = threading.Lock()
+
+
+def flush_logs():
+    """
+    Espera a que los registros encolados se escriban en sus archivos
+    """
+    for _, listener in list(_LOG_LISTENERS.values()):
+        listener.queue.join()
+
+
+def shutdown_logging():
+    """
+    Escribe los registros pendientes y detiene los hilos de escritura de logs
+    """
+    logger = logging.getLogger(__name__)
+    with _LOG_LOCK:
+        for queue_handler, listener in _LOG_LISTENERS.values():
+            logger.removeHandler(queue_handler)
+            listener.stop()
+            for handler in listener.handlers:
+                handler.close()
+        _LOG_LISTENERS.clear()
+
+
+atexit.register(shutdown_logging)
 
 
 class BackupOrchestrator:
@@ -20,83 +62,315 @@ class BackupOrchestrator:
     Orquestador de backups para PostgreSQL con contenedores Docker
     """
 
+    # Extensiones reconocidas como archivos de backup
+    BACKUP_EXTENSIONS = ('.sql', '.sql.gz', '.dump', '.tar')
+
+    # Extensión del archivo de backup según el formato de pg_dump
+    FORMAT_EXTENSIONS = {'custom': '.dump', 'directory': '.tar'}
+
+    # Segundos durante los que se reutiliza una verificación positiva del contenedor
+    CONTAINER_CHECK_TTL = 30.0
+
+    # Como mucho un punto de progreso por segundo y 60 puntos por backup
+    PROGRESS_TICK_INTERVAL = 1.0
+    PROGRESS_MAX_DOTS = 60
+
     def __init__(self, container_name: str = "pc_db", backup_dir: str = "backups", 
-                 show_progress: bool = True, use_colors: bool = True):
+                 show_progress: bool = True, use_colors: bool = True, compress: bool = True,
+                 db_host: str = None, db_port: int = 5432, dump_format: str = "plain",
+                 jobs: int = 1):
         self.container_name = container_name
+        # El directorio y el logging se preparan en el primer uso: --list no los necesita
         self.backup_dir = Path(backup_dir)
-        self.backup_dir.mkdir(exist_ok=True)
+        self._logger = None
         self.show_progress = show_progress
         self.use_colors = use_colors
+        self.compress = compress
+        # Solo el formato directorio admite varios workers de pg_dump
+        if jobs < 1:
+            raise ValueError(f"El número de workers debe ser mayor que 0: {jobs}")
+        if jobs > 1 and dump_format == "custom":
+            raise ValueError("El formato custom no admite varios workers; use --format directory")
+        self.jobs = jobs
+        self.dump_format = "directory" if self.jobs > 1 else dump_format
+        self.backup_extension = self.FORMAT_EXTENSIONS.get(
+            self.dump_format, '.sql.gz' if compress else '.sql'
+        )
         
         if not use_colors:
             Colors.disable()
 
+        # Prefijos [NIVEL] calculados una sola vez para los mensajes de consola
+        self._level_prefix = build_level_prefixes(use_colors)
+
         self.db_config = {
             "user": "postgres",
             "password": "12345",
             "database": "pc_db",
+            "host": db_host,
+            "port": db_port,
         }
 
-        self.setup_logging()
+        # Conexión reutilizable con el daemon de Docker, creada en la primera verificación
+        self._docker = None
+        self._container_ok_until = 0.0
+        # Último listado junto al mtime del directorio con el que se obtuvo
+        self._backup_cache = None
+
+        # Comando de pg_dump fijo para este contenedor y base de datos
+        pg_dump_args = (
+            "-U", self.db_config["user"],
+            "-d", self.db_config["database"],
+        )
+        if self.dump_format == "custom":
+            # Formato de archivo de pg_dump: comprimido por defecto y restaurable
+            # en paralelo con pg_restore -j; --clean/--create se indican al restaurar
+            pg_dump_args += ("-Fc",) if compress else ("-Fc", "-Z", "0")
+        elif self.dump_format == "directory":
+            # Formato directorio: una tabla por worker, comprimido por defecto
+            pg_dump_args += ("-Fd", "-j", str(self.jobs))
+            if not compress:
+                pg_dump_args += ("-Z", "0")
+        else:
+            pg_dump_args += ("--clean", "--create")
+            if compress:
+                # pg_dump comprime con gzip antes de escribir la salida
+                pg_dump_args += ("-Z", "6")
+
+        # Con un host explícito y pg_dump instalado localmente se evita el
+        # reenvío de toda la salida a través de docker exec
+        self.direct_connection = bool(db_host) and shutil.which("pg_dump") is not None
+        if self.direct_connection:
+            pg_dump = ("pg_dump", "-h", db_host, "-p", str(db_port)) + pg_dump_args
+            prefix = ()
+        else:
+            pg_dump = ("pg_dump",) + pg_dump_args
+            # docker exec no reenvía el entorno del host: -e PGPASSWORD sin valor
+            # lo copia al contenedor sin exponer la contraseña en la línea de comandos
+            prefix = ("docker", "exec", "-e", "PGPASSWORD", self.container_name)
+
+        # Entorno para subprocesos, preparado una sola vez por instancia
+        self._exec_env = {**os.environ, "PGPASSWORD": self.db_config["password"]}
+
+        if self.dump_format == "directory":
+            pg_dump = self._directory_dump_script(pg_dump)
+        self._pg_dump_cmd = prefix + pg_dump
+
+    @staticmethod
+    def _directory_dump_script(pg_dump: tuple) -> tuple:
+        """
+        Envuelve pg_dump -Fd en un script que vuelca a un directorio temporal
+        y lo emite como tar por stdout, limpiando el directorio al terminar
+        """
+        script = (
+            'set -e; dir=$(mktemp -d); trap \'rm -rf "$dir"\' EXIT; '
+            f'{shlex.join(pg_dump)} -f "$dir/dump"; '
+            'tar -cf - -C "$dir" dump'
+        )
+        return ("sh", "-c", script)
+
+    @property
+    def logger(self) -> logging.Logger:
+        """Logger del orquestador, configurado en el primer uso"""
+        if self._logger is None:
+            self.setup_logging()
+        return self._logger
 
     def setup_logging(self):
         """
         Configura el sistema de logging
         """
-        log_file = self.backup_dir / "backup_orchestrator.log"
+        import queue
+        from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+        os.makedirs(self.backup_dir, exist_ok=True)
+        log_file = os.path.abspath(self.backup_dir / "backup_orchestrator.log")
+
+        logger = logging.getLogger(__name__)
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+
+        with _LOG_LOCK:
+            # Otra instancia ya registró este archivo: reutilizar su cola
+            entry = _LOG_LISTENERS.get(log_file)
+            if entry is None:
+                # Configurar logging solo a archivo, la salida de consola la maneja el indicador de progreso.
+                # El archivo rota al llegar a 5 MB y no se abre hasta el primer registro.
+                rotating_handler = RotatingFileHandler(
+                    log_file, maxBytes=5_000_000, backupCount=3, encoding='utf-8', delay=True
+                )
+                rotating_handler.setFormatter(_LOG_FORMATTER)
 
-        # Configurar logging solo a archivo, la salida de consola la maneja el indicador de progreso
-        file_handler = logging.FileHandler(log_file, encoding='utf-8')
-        file_handler.setLevel(logging.INFO)
-        file_formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
-        file_handler.setFormatter(file_formatter)
+                # Los registros se encolan y un hilo en segundo plano los escribe en disco
+                queue_handler = QueueHandler(queue.Queue())
+                queue_handler.setLevel(logging.INFO)
+                listener = QueueListener(queue_handler.queue, rotating_handler, respect_handler_level=True)
+                listener.start()
+                entry = _LOG_LISTENERS[log_file] = (queue_handler, listener)
 
-        self.logger = logging.getLogger(__name__)
-        self.logger.setLevel(logging.INFO)
-        self.logger.addHandler(file_handler)
+            if entry[0] not in logger.handlers:
+                logger.addHandler(entry[0])
+        self._logger = logger
 
     def _print_message(self, level: str, message: str):
         """Imprime mensaje con color si el progreso está habilitado"""
         if self.show_progress:
-            print_colored_message(level, message, self.use_colors)
+            prefix = self._level_prefix.get(level) or level_prefix(level, self.use_colors)
+            print(f"{prefix} {message}")
+
+    def _progress(self, message: str) -> ProgressIndicator:
+        """
+        Crea un indicador de progreso, o devuelve el indicador nulo en modo silencioso
+        """
+        if not self.show_progress:
+            return NULL_PROGRESS
+        return ProgressIndicator(message, self.use_colors)
+
+    @staticmethod
+    def _growth_reporter(fileno: int, progress: ProgressIndicator,
+                         min_interval: float = PROGRESS_TICK_INTERVAL,
+                         max_dots: int = PROGRESS_MAX_DOTS):
+        """
+        Devuelve un callback que avanza el progreso cuando el archivo crece,
+        con al menos min_interval segundos entre puntos y hasta max_dots puntos
+        """
+        last_size = 0
+        last_dot = None
+        dots = 0
+
+        def report():
+            nonlocal last_size, last_dot, dots
+            if dots >= max_dots:
+                return
+            now = time.monotonic()
+            if last_dot is not None and now - last_dot < min_interval:
+                return
+            size = os.fstat(fileno).st_size
+            if size > last_size:
+                last_size = size
+                last_dot = now
+                dots += 1
+                progress.update(".")
+
+        return report
 
     def _check_docker_container(self) -> bool:
         """
         Verifica si el contenedor Docker está disponible
         """
+        if time.monotonic() < self._container_ok_until:
+            return True
+
+        if self._query_container_running():
+            self._container_ok_until = time.monotonic() + self.CONTAINER_CHECK_TTL
+            return True
+        return False
+
+    def _query_container_running(self) -> bool:
+        """
+        Consulta al daemon de Docker si el contenedor está en ejecución
+        """
+        # Importación diferida: http.client es costoso y --list/--help no lo necesitan
+        from backup_cli.utils.docker_api import DockerEngineClient, DockerAPIUnavailable
+
+        if self._docker is None:
+            self._docker = DockerEngineClient()
         try:
+            return self._docker.container_running(self.container_name)
+        except DockerAPIUnavailable:
+            pass  # Sin acceso al socket: recurrir al CLI de docker
+
+        try:
+            # --format hace que docker emita solo el estado en lugar de todo el JSON
             result = subprocess.run(
-                ["docker", "inspect", self.container_name],
+                ["docker", "inspect", "--format", "{{.State.Running}}", self.container_name],
                 capture_output=True,
                 text=True,
                 timeout=10
             )
-            return result.returncode == 0
+            return result.returncode == 0 and result.stdout.strip() == "true"
         except (subprocess.TimeoutExpired, FileNotFoundError):
             return False
 
-    def list_backups(self) -> list[dict]:
+    @staticmethod
+    def _release_page_cache(backup_path: Path):
+        """
+        Asegura el backup en disco y pide al kernel descartar sus páginas de la caché,
+        para no desplazar datos más usados (como los de la propia base de datos)
         """
-        Lista todos los backups disponibles en el directorio
+        if not hasattr(os, 'posix_fadvise'):
+            return
+        try:
+            fd = os.open(backup_path, os.O_RDONLY)
+        except OSError:
+            return
+        try:
+            # Solo se descartan páginas limpias: escribir primero las pendientes
+            os.fdatasync(fd)
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+    def list_backups(self, limit: int = None) -> list[dict]:
+        """
+        Lista los backups del directorio, del más reciente al más antiguo (hasta limit).
+        El recorrido se reutiliza mientras el directorio no cambie
+        """
+        if limit is not None and limit < 1:
+            raise ValueError(f"El límite debe ser mayor que 0: {limit}")
+        try:
+            dir_mtime = os.stat(self.backup_dir).st_mtime_ns
+        except (FileNotFoundError, NotADirectoryError):
+            return []
+        if self._backup_cache is not None and self._backup_cache[0] == dir_mtime:
+            found = self._backup_cache[1]
+        else:
+            # scandir reutiliza la información del directorio en lugar de un stat por archivo
+            found = []
+            with os.scandir(self.backup_dir) as entries:
+                for entry in entries:
+                    if entry.name.endswith(self.BACKUP_EXTENSIONS) and entry.is_file():
+                        stat = entry.stat()
+                        found.append((stat.st_mtime, stat.st_size, entry.name, entry.path))
+            # Ordenar por el mtime numérico; en caché quedan solo las tuplas
+            found.sort(reverse=True)
+            self._backup_cache = (dir_mtime, found)
+
+        # Los diccionarios se crean solo para las filas pedidas
+        return [
+            {
+                'name': name,
+                'size': size,
+                'modified': datetime.fromtimestamp(mtime),
+                'path': Path(path)
+            }
+            for mtime, size, name, path in found[:limit]
+        ]
+
+    def clear_backup_cache(self):
         """
-        backups = []
-        for backup_file in self.backup_dir.glob("*.sql"):
-            stat = backup_file.stat()
-            backups.append({
-                'name': backup_file.name,
-                'size': stat.st_size,
-                'modified': datetime.fromtimestamp(stat.st_mtime),
-                'path': backup_file
-            })
-        return sorted(backups, key=lambda x: x['modified'], reverse=True)
+        Descarta el listado en caché; el tamaño de un archivo que se está
+        escribiendo cambia sin que cambie el mtime del directorio
+        """
+        self._backup_cache = None
 
     def create_backup(self, custom_name: str = None, force_overwrite: bool = False) -> bool:
         """
         Crea un backup de la base de datos usando docker exec y pg_dump
         """
+        try:
+            return self._create_backup(custom_name, force_overwrite)
+        finally:
+            self.clear_backup_cache()
+
+    def _create_backup(self, custom_name: str, force_overwrite: bool) -> bool:
+        """Implementación de create_backup"""
+        os.makedirs(self.backup_dir, exist_ok=True)
         try:
             backup_filename, name_modified = BackupNameValidator.resolve_backup_filename(
-                self.backup_dir, custom_name, force_overwrite
+                self.backup_dir, custom_name, force_overwrite, self.backup_extension
             )
         except ValueError as e:
             self._print_message('ERROR', str(e))
@@ -110,113 +384,96 @@ class BackupOrchestrator:
             self._print_message('WARNING', f"Nombre de backup modificado para evitar conflicto: {backup_filename}")
 
         # Indicadores de progreso
-        container_check = ProgressIndicator(f"Verificando contenedor '{self.container_name}'", self.use_colors)
-        backup_progress = ProgressIndicator(f"Creando backup '{backup_filename}'", self.use_colors)
+        container_check = self._progress(f"Verificando contenedor '{self.container_name}'")
+        backup_progress = self._progress(f"Creando backup '{backup_filename}'")
+        # Archivo temporal propio del backup en curso; se descarta si no llega a completarse
+        tmp_path = None
         
         try:
             # Verificar disponibilidad del contenedor
-            if self.show_progress:
-                container_check.start()
-                time.sleep(0.5)  # Pausa breve para feedback visual
+            container_check.start()
                 
             if not self._check_docker_container():
-                if self.show_progress:
-                    container_check.complete(False)
+                container_check.complete(False)
                 error_msg = f"Contenedor '{self.container_name}' no encontrado o no está ejecutándose"
                 self._print_message('ERROR', error_msg)
                 self.logger.error(error_msg)
                 return False
                 
-            if self.show_progress:
-                container_check.complete(True)
+            container_check.complete(True)
 
             self.logger.info(f"Iniciando el backup: {backup_filename}")
 
-            cmd = [
-                "docker", "exec", self.container_name,
-                "pg_dump",
-                "-U", self.db_config["user"],
-                "-d", self.db_config["database"],
-                "--clean",
-                "--create"
-            ]
-
             # Iniciar progreso de backup
-            if self.show_progress:
-                backup_progress.start()
-
-            env = os.environ.copy()
-            env["PGPASSWORD"] = self.db_config["password"]
-
-            with open(backup_path, 'w', encoding='utf-8') as f:
-                result = subprocess.run(
-                    cmd,
+            backup_progress.start()
+
+            # pg_dump escribe sobre un archivo nuevo (O_EXCL) que luego reemplaza al
+            # nombre final: nunca se trunca un inodo existente, que puede ser un
+            # enlace duro compartido con otros backups
+            import tempfile
+            fd, tmp_name = tempfile.mkstemp(
+                prefix=f".{backup_filename}.", suffix=".tmp", dir=self.backup_dir
+            )
+            tmp_path = Path(tmp_name)
+            with os.fdopen(fd, 'wb') as f:
+                proc = subprocess.Popen(
+                    self._pg_dump_cmd,
                     stdout=f,
                     stderr=subprocess.PIPE,
-                    text=True,
-                    env=env,
-                    timeout=300
+                    env=self._exec_env
                 )
-                
-                # Simular actualizaciones de progreso durante el backup
-                if self.show_progress:
-                    backup_progress.simulate_work()
-
-            if result.returncode == 0:
+                on_tick = self._growth_reporter(f.fileno(), backup_progress) if self.show_progress else None
+                stderr = wait_for_process(
+                    proc, timeout=300, on_tick=on_tick, tick_interval=self.PROGRESS_TICK_INTERVAL
+                ).decode('utf-8', errors='replace')
+
+            if proc.returncode == 0:
+                os.replace(tmp_path, backup_path)
+                tmp_path = None
                 file_size = backup_path.stat().st_size
                 self.logger.info(f"Backup completado exitosamente: {backup_filename} ({file_size} bytes)")
                 
-                if self.show_progress:
-                    backup_progress.complete(True)
-                    self._print_message('INFO', f"Tamaño del backup: {format_file_size(file_size)}")
-                    self._print_message('INFO', f"Ubicación: {backup_path.absolute()}")
-                    
+                backup_progress.complete(True)
+                self._print_message('INFO', f"Tamaño del backup: {format_file_size(file_size)}")
+                self._print_message('INFO', f"Ubicación: {backup_path.absolute()}")
+
+                self._release_page_cache(backup_path)
                 return True
             else:
-                self.logger.error(f"Error en pg_dump: {result.stderr}")
-                if self.show_progress:
-                    backup_progress.complete(False)
-                self._print_message('ERROR', f"pg_dump falló: {result.stderr.strip()}")
-                    
-                if backup_path.exists():
-                    backup_path.unlink()
+                self.logger.error(f"Error en pg_dump: {stderr}")
+                backup_progress.complete(False)
+                self._print_message('ERROR', f"pg_dump falló: {stderr.strip()}")
                 return False
 
         except subprocess.TimeoutExpired:
             error_msg = "Timeout en pg_dump - el proceso tomó más de 5 minutos"
             self.logger.error(error_msg)
-            if self.show_progress:
-                backup_progress.complete(False)
+            backup_progress.complete(False)
             self._print_message('ERROR', "Timeout del backup (>5 minutos)")
-                
-            if backup_path.exists():
-                backup_path.unlink()
             return False
 
         except FileNotFoundError:
             error_msg = "Error: Docker no encontrado"
             self.logger.error(error_msg)
-            if self.show_progress:
-                backup_progress.complete(False)
+            backup_progress.complete(False)
             self._print_message('ERROR', "Comando docker no encontrado")
-                
             return False
         except Exception as e:
             self.logger.error(f"Error inesperado durante el backup: {e}")
-            if self.show_progress:
-                backup_progress.complete(False)
+            backup_progress.complete(False)
             self._print_message('ERROR', f"Error inesperado: {e}")
-                
-            if backup_path.exists():
-                backup_path.unlink()
             return False
 
+        finally:
+            if tmp_path is not None:
+                tmp_path.unlink(missing_ok=True)
+
 
-def display_backup_list(orchestrator: BackupOrchestrator, use_colors: bool):
+def display_backup_list(orchestrator: BackupOrchestrator, use_colors: bool, limit: int = None):
     """
-    Muestra la lista de backups disponibles
+    Muestra la lista de backups disponibles (los limit más recientes si se indica)
     """
-    backups = orchestrator.list_backups()
+    backups = orchestrator.list_backups(limit)
     if not backups:
         if use_colors:
             print(f"{Colors.YELLOW}No se encontraron archivos de backup{Colors.RESET}")
@@ -224,22 +481,29 @@ def display_backup_list(orchestrator: BackupOrchestrator, use_colors: bool):
             print("No se encontraron archivos de backup")
         return 0
         
-    # Encabezado
+    # Encabezado y plantilla de fila, preparados una vez por modo de color
     if use_colors:
-        print(f"{Colors.CYAN}{Colors.BOLD}Archivos de backup en {orchestrator.backup_dir}:{Colors.RESET}")
-        print(f"{Colors.CYAN}{'-' * 60}{Colors.RESET}")
+        lines = [
+            f"{Colors.CYAN}{Colors.BOLD}Archivos de backup en {orchestrator.backup_dir}:{Colors.RESET}",
+            f"{Colors.CYAN}{'-' * 60}{Colors.RESET}",
+        ]
+        row_template = (
+            f"{Colors.WHITE}{{0:<30}}{Colors.RESET} "
+            f"{Colors.BRIGHT_BLUE}{{1:>10}}{Colors.RESET} "
+            f"{Colors.MAGENTA}{{2}}{Colors.RESET}"
+        )
     else:
-        print(f"Archivos de backup en {orchestrator.backup_dir}:")
-        print("-" * 60)
-        
-    for backup in backups:
-        size_str = format_file_size(backup['size'])
-        if use_colors:
-            print(f"{Colors.WHITE}{backup['name']:<30}{Colors.RESET} "
-                  f"{Colors.BRIGHT_BLUE}{size_str:>10}{Colors.RESET} "
-                  f"{Colors.MAGENTA}{backup['modified']}{Colors.RESET}")
-        else:
-            print(f"{backup['name']:<30} {size_str:>10} {backup['modified']}")
+        lines = [f"Archivos de backup en {orchestrator.backup_dir}:", "-" * 60]
+        row_template = "{0:<30} {1:>10} {2}"
+
+    format_row = row_template.format
+    lines.extend(
+        format_row(backup['name'], format_file_size(backup['size']), backup['modified'])
+        for backup in backups
+    )
+
+    # Una sola escritura para todo el listado
+    sys.stdout.write("\n".join(lines) + "\n")
     return 0
 
 
@@ -259,12 +523,34 @@ def display_header(orchestrator: BackupOrchestrator, use_colors: bool):
         print("-" * 40)
 
 
+def backup_containers_concurrently(containers: list[str], orchestrator_kwargs: dict,
+                                   custom_name: str = None,
+                                   force_overwrite: bool = False) -> dict[str, bool]:
+    """
+    Crea un backup por contenedor en paralelo y devuelve el resultado de cada uno.
+    Los nombres incluyen el contenedor para que no colisionen entre sí
+    """
+    timestamp = backup_timestamp()
+
+    def run(container: str) -> bool:
+        # Sin indicador de progreso: las salidas de varios hilos se mezclarían
+        orchestrator = BackupOrchestrator(container_name=container, show_progress=False,
+                                          **orchestrator_kwargs)
+        name = f"{custom_name}_{container}" if custom_name else f"backup_{container}_{timestamp}"
+        return orchestrator.create_backup(custom_name=name, force_overwrite=force_overwrite)
+
+    # Los hilos pasan casi todo el tiempo esperando a pg_dump, fuera del GIL
+    with ThreadPoolExecutor(max_workers=min(len(containers), os.cpu_count() or 1)) as executor:
+        return dict(zip(containers, executor.map(run, containers)))
+
+
 def main():
     """
     Función principal con interfaz de línea de comandos
     """
     parser = create_cli_parser()
     args = parser.parse_args()
+    validate_cli_args(parser, args)
     config = CLIConfig(args)
     
     # Determinar si se deben usar colores
@@ -277,16 +563,40 @@ def main():
         logging.getLogger().setLevel(logging.DEBUG)
     
     try:
+        orchestrator_kwargs = dict(
+            backup_dir=config.backup_dir,
+            use_colors=use_colors,
+            db_host=config.db_host,
+            db_port=config.db_port,
+            compress=config.compress,
+            dump_format=config.dump_format,
+            jobs=config.jobs
+        )
+
+        if len(config.containers) > 1 and not config.list:
+            if config.show_progress:
+                print_colored_message(
+                    'INFO', f"Respaldando en paralelo: {', '.join(config.containers)}", use_colors
+                )
+            results = backup_containers_concurrently(
+                config.containers, orchestrator_kwargs, config.name, config.force
+            )
+            for container, ok in results.items():
+                if ok:
+                    print_colored_message('SUCCESS', f"{container}: backup completado", use_colors)
+                else:
+                    print_colored_message('FAILED', f"{container}: el backup falló", use_colors)
+            return 0 if all(results.values()) else 1
+
         orchestrator = BackupOrchestrator(
             container_name=config.container,
-            backup_dir=config.backup_dir,
             show_progress=config.show_progress,
-            use_colors=use_colors
+            **orchestrator_kwargs
         )
         
         # Manejar comando de lista
         if config.list:
-            return display_backup_list(orchestrator, use_colors)
+            return display_backup_list(orchestrator, use_colors, config.limit)
         
         if config.show_progress:
             display_header(orchestrator, use_colors)
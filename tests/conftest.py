@@ -4,43 +4,68 @@ Incluye fixtures y configuraciones globales de pytest.
 """
 
 import pytest
-import tempfile
-import shutil
-from pathlib import Path
 from unittest.mock import Mock, patch
-from backup_orchestrator import BackupOrchestrator
+from backup_orchestrator import BackupOrchestrator, shutdown_logging
+from backup_cli.utils import colors
+from backup_cli.utils.docker_api import DockerAPIUnavailable
+
+
+@pytest.fixture(autouse=True)
+def restore_colors():
+    """
+    Fixture que restaura los códigos ANSI tras cada test.
+    Colors.disable() modifica el estado global de la clase y sus plantillas.
+    """
+    saved_attrs = {attr: getattr(colors.Colors, attr) for attr in colors.Colors._COLOR_ATTRS}
+    saved_templates = dict(colors._COLOR_TEMPLATES)
+    yield
+    for attr, value in saved_attrs.items():
+        setattr(colors.Colors, attr, value)
+    colors._COLOR_TEMPLATES.clear()
+    colors._COLOR_TEMPLATES.update(saved_templates)
+
+
+@pytest.fixture
+def temp_backup_dir(tmp_path):
+    """
+    Fixture que provee un directorio temporal para backups durante las pruebas.
+    pytest gestiona su creación y la limpieza de directorios antiguos.
+    """
+    yield tmp_path
+    # Escribir y cerrar los logs creados en el test
+    shutdown_logging()
 
 
 @pytest.fixture
-def temp_backup_dir():
+def docker_api_unavailable():
     """
-    Fixture que crea un directorio temporal para backups durante las pruebas.
-    Se limpia automáticamente después de cada test.
+    Fixture que simula que el socket de Docker no es accesible,
+    forzando la verificación mediante el CLI de docker.
     """
-    temp_dir = tempfile.mkdtemp(prefix="test_backup_")
-    yield Path(temp_dir)
-    shutil.rmtree(temp_dir, ignore_errors=True)
+    with patch('backup_cli.utils.docker_api.DockerEngineClient.container_running') as mock_api:
+        mock_api.side_effect = DockerAPIUnavailable("socket no disponible")
+        yield mock_api
 
 
 @pytest.fixture
-def mock_docker_container():
+def mock_docker_container(docker_api_unavailable):
     """
     Fixture que simula un contenedor Docker disponible.
     """
     with patch('subprocess.run') as mock_run:
-        # Simular que docker inspect retorna éxito (contenedor existe)
-        mock_run.return_value = Mock(returncode=0)
+        # Simular que docker inspect retorna éxito (contenedor en ejecución)
+        mock_run.return_value = Mock(returncode=0, stdout="true\n")
         yield mock_run
 
 
 @pytest.fixture
-def mock_docker_container_not_found():
+def mock_docker_container_not_found(docker_api_unavailable):
     """
     Fixture que simula un contenedor Docker no encontrado.
     """
     with patch('subprocess.run') as mock_run:
         # Simular que docker inspect falla (contenedor no existe)
-        mock_run.return_value = Mock(returncode=1)
+        mock_run.return_value = Mock(returncode=1, stdout="")
         yield mock_run
 
 
@@ -2,12 +2,22 @@
 Tests unitarios para las funciones principales del BackupOrchestrator.
 """
 
+import io
+import os
 import pytest
 import subprocess
+import tarfile
+import threading
+import time
 from pathlib import Path
 from datetime import datetime
+from logging.handlers import QueueHandler
 from unittest.mock import patch, Mock, mock_open
-from backup_orchestrator import BackupOrchestrator
+from backup_orchestrator import (
+    BackupOrchestrator, display_backup_list, backup_containers_concurrently, flush_logs,
+    shutdown_logging, _LOG_LISTENERS
+)
+from backup_cli.utils.progress import ProgressIndicator, NULL_PROGRESS
 
 
 class TestBackupOrchestrator:
@@ -34,6 +44,258 @@ class TestBackupOrchestrator:
         assert orchestrator.db_config["password"] == "12345"
         assert orchestrator.db_config["database"] == "pc_db"
 
+    def test_exec_env_prepared_once(self, orchestrator_instance):
+        """
+        Test que verifica que el entorno de subprocesos se prepara en __init__.
+        """
+        assert orchestrator_instance._exec_env["PGPASSWORD"] == "12345"
+        # docker exec debe reenviar la variable al contenedor
+        assert orchestrator_instance._pg_dump_cmd[:5] == ("docker", "exec", "-e", "PGPASSWORD", "test_db")
+
+        with patch('backup_orchestrator.BackupOrchestrator._check_docker_container', return_value=True), \
+             patch('subprocess.Popen') as mock_subprocess, \
+             patch('backup_orchestrator.wait_for_process', return_value=b""), \
+             patch('backup_orchestrator.open', new_callable=mock_open, create=True), \
+             patch.object(Path, 'stat') as mock_stat:
+            mock_subprocess.return_value = Mock(returncode=0)
+            mock_stat.return_value.st_size = 1024
+
+            assert orchestrator_instance.create_backup() is True
+            assert mock_subprocess.call_args[1]['env'] is orchestrator_instance._exec_env
+
+    @pytest.mark.parametrize("db_host,local_pg_dump,expected_prefix", [
+        (None, "/usr/bin/pg_dump", ("docker", "exec", "-e", "PGPASSWORD", "test_db", "pg_dump")),
+        ("127.0.0.1", "/usr/bin/pg_dump", ("pg_dump", "-h", "127.0.0.1", "-p", "5433")),
+        ("127.0.0.1", None, ("docker", "exec", "-e", "PGPASSWORD", "test_db", "pg_dump")),
+    ])
+    def test_pg_dump_command_connection_mode(self, temp_backup_dir, db_host, local_pg_dump,
+                                             expected_prefix):
+        """
+        Test parametrizado que verifica cuándo se ejecuta pg_dump desde el host.
+        """
+        with patch('backup_orchestrator.shutil.which', return_value=local_pg_dump):
+            orchestrator = BackupOrchestrator(
+                container_name="test_db",
+                backup_dir=str(temp_backup_dir),
+                show_progress=False,
+                use_colors=False,
+                db_host=db_host,
+                db_port=5433
+            )
+
+        assert orchestrator._pg_dump_cmd[:len(expected_prefix)] == expected_prefix
+        assert orchestrator.direct_connection is (expected_prefix[0] == "pg_dump")
+        assert orchestrator._exec_env["PGPASSWORD"] == "12345"
+
+    @pytest.mark.parametrize("dump_format,compress,extension,format_args", [
+        ("plain", True, ".sql.gz", ("--clean", "--create", "-Z", "6")),
+        ("plain", False, ".sql", ("--clean", "--create")),
+        ("custom", True, ".dump", ("-Fc",)),
+        ("custom", False, ".dump", ("-Fc", "-Z", "0")),
+    ])
+    def test_pg_dump_output_format(self, temp_backup_dir, dump_format, compress, extension,
+                                   format_args):
+        """
+        Test parametrizado que verifica los argumentos y la extensión según el formato.
+        """
+        orchestrator = BackupOrchestrator(
+            backup_dir=str(temp_backup_dir),
+            show_progress=False,
+            use_colors=False,
+            compress=compress,
+            dump_format=dump_format
+        )
+
+        assert orchestrator.backup_extension == extension
+        assert orchestrator._pg_dump_cmd[-len(format_args):] == format_args
+        assert extension.endswith(BackupOrchestrator.BACKUP_EXTENSIONS)
+
+    @pytest.mark.parametrize("db_host,local_pg_dump,expected_prefix", [
+        (None, "/usr/bin/pg_dump", ("docker", "exec", "-e", "PGPASSWORD", "test_db", "sh", "-c")),
+        ("127.0.0.1", "/usr/bin/pg_dump", ("sh", "-c")),
+    ])
+    def test_parallel_jobs_use_directory_format(self, temp_backup_dir, db_host, local_pg_dump,
+                                                expected_prefix):
+        """
+        Test que verifica que con varios workers se vuelca en formato directorio como tar.
+        """
+        with patch('backup_orchestrator.shutil.which', return_value=local_pg_dump):
+            orchestrator = BackupOrchestrator(
+                container_name="test_db",
+                backup_dir=str(temp_backup_dir),
+                show_progress=False,
+                use_colors=False,
+                db_host=db_host,
+                jobs=4
+            )
+
+        assert orchestrator.dump_format == "directory"
+        assert orchestrator.backup_extension == ".tar"
+        assert orchestrator._pg_dump_cmd[:-1] == expected_prefix
+        script = orchestrator._pg_dump_cmd[-1]
+        assert script.startswith("set -e;")
+        assert "-U postgres -d pc_db -Fd -j 4 -f \"$dir/dump\"" in script
+        assert script.endswith('tar -cf - -C "$dir" dump')
+
+    @pytest.mark.parametrize("dump_format,jobs", [("plain", 0), ("plain", -3), ("custom", 4)])
+    def test_invalid_jobs_rejected(self, temp_backup_dir, dump_format, jobs):
+        """
+        Test parametrizado que verifica que los workers inválidos no se corrigen en silencio.
+        """
+        with pytest.raises(ValueError):
+            BackupOrchestrator(
+                backup_dir=str(temp_backup_dir),
+                show_progress=False,
+                use_colors=False,
+                dump_format=dump_format,
+                jobs=jobs
+            )
+
+    def test_directory_dump_script_runs_pipeline(self, tmp_path):
+        """
+        Test que verifica que el script emite el directorio como tar y propaga errores.
+        """
+        fake_dump = ("sh", "-c", 'mkdir -p "$2" && echo datos > "$2/toc.dat"', "pg_dump")
+        script = BackupOrchestrator._directory_dump_script(fake_dump)
+
+        result = subprocess.run(script, capture_output=True)
+        assert result.returncode == 0
+        with tarfile.open(fileobj=io.BytesIO(result.stdout)) as tar:
+            assert "dump/toc.dat" in tar.getnames()
+
+        failing = BackupOrchestrator._directory_dump_script(("false",))
+        assert subprocess.run(failing, capture_output=True).returncode != 0
+
+    def test_print_message_uses_cached_prefixes(self, temp_backup_dir):
+        """
+        Test que verifica los mensajes de consola con prefijos precalculados.
+        """
+        orchestrator = BackupOrchestrator(
+            backup_dir=str(temp_backup_dir),
+            show_progress=True,
+            use_colors=False
+        )
+
+        with patch('builtins.print') as mock_print:
+            orchestrator._print_message('INFO', 'mensaje')
+            orchestrator._print_message('DEBUG', 'otro')
+
+        assert mock_print.call_args_list[0][0][0] == '[INFO] mensaje'
+        assert mock_print.call_args_list[1][0][0] == '[DEBUG] otro'
+
+    def test_backup_dir_and_logging_deferred_until_backup(self, tmp_path):
+        """
+        Test que verifica que listar no crea el directorio ni configura el logging.
+        """
+        backup_dir = tmp_path / "sin_crear"
+        orchestrator = BackupOrchestrator(
+            backup_dir=str(backup_dir),
+            show_progress=False,
+            use_colors=False
+        )
+
+        assert orchestrator.list_backups() == []
+        assert not backup_dir.exists()
+        assert orchestrator._logger is None
+
+        with patch.object(BackupOrchestrator, '_check_docker_container', return_value=False):
+            assert orchestrator.create_backup() is False
+
+        assert backup_dir.is_dir()
+        assert orchestrator._logger is not None
+
+        # El log apunta a tmp_path: detener su escritura antes de que pytest borre el directorio
+        shutdown_logging()
+
+    def test_logging_handler_shared_between_instances(self, temp_backup_dir):
+        """
+        Test que verifica que varias instancias no duplican el handler del mismo archivo.
+        """
+        first = BackupOrchestrator(backup_dir=str(temp_backup_dir), show_progress=False, use_colors=False)
+        second = BackupOrchestrator(backup_dir=str(temp_backup_dir), show_progress=False, use_colors=False)
+
+        handlers_before = len(first.logger.handlers)
+        assert len(second.logger.handlers) == handlers_before
+        assert first.logger.propagate is False
+
+        second.logger.error("registro único")
+        flush_logs()
+        content = (temp_backup_dir / "backup_orchestrator.log").read_text(encoding='utf-8')
+        assert content.count("registro único") == 1
+
+    def test_log_written_in_background_and_flushed_on_shutdown(self, orchestrator_instance,
+                                                               temp_backup_dir):
+        """
+        Test que verifica que el log se escribe en segundo plano y no se crea sin registros.
+        """
+        log_file = temp_backup_dir / "backup_orchestrator.log"
+        orchestrator_instance.logger  # Configura el logging sin emitir registros
+        flush_logs()
+        assert not log_file.exists()
+
+        orchestrator_instance.logger.info("registro informativo")
+        flush_logs()
+        assert "registro informativo" in log_file.read_text(encoding='utf-8')
+
+        # Al detener el logging se escriben los registros aún encolados
+        orchestrator_instance.logger.error("registro de error")
+        shutdown_logging()
+        content = log_file.read_text(encoding='utf-8')
+        assert "ERROR - registro de error" in content
+        assert not any(isinstance(h, QueueHandler) for h in orchestrator_instance.logger.handlers)
+
+    def test_concurrent_logging_setup_registers_one_listener(self, temp_backup_dir):
+        """
+        Test que verifica que varios hilos configuran el logging una sola vez por archivo.
+        """
+        from logging.handlers import QueueListener
+        original_start = QueueListener.start
+
+        def slow_start(listener):
+            # Ampliar la ventana entre la consulta y el registro del listener
+            time.sleep(0.05)
+            original_start(listener)
+
+        orchestrators = [
+            BackupOrchestrator(backup_dir=str(temp_backup_dir), show_progress=False, use_colors=False)
+            for _ in range(4)
+        ]
+        barrier = threading.Barrier(len(orchestrators))
+
+        def setup(orchestrator):
+            barrier.wait()
+            orchestrator.logger
+
+        with patch.object(QueueListener, 'start', slow_start):
+            threads = [threading.Thread(target=setup, args=(o,)) for o in orchestrators]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        logger = orchestrators[0].logger
+        assert len(_LOG_LISTENERS) == 1
+        assert sum(isinstance(h, QueueHandler) for h in logger.handlers) == 1
+
+    @pytest.mark.parametrize("show_progress", [True, False])
+    def test_progress_indicator_only_built_when_enabled(self, temp_backup_dir, show_progress):
+        """
+        Test parametrizado que verifica que en modo silencioso se usa el indicador nulo.
+        """
+        orchestrator = BackupOrchestrator(
+            backup_dir=str(temp_backup_dir),
+            show_progress=show_progress,
+            use_colors=False
+        )
+
+        progress = orchestrator._progress("Operación")
+
+        if show_progress:
+            assert type(progress) is ProgressIndicator
+            assert progress.message == "Operación"
+        else:
+            assert progress is NULL_PROGRESS
+
     def test_list_backups_empty_directory(self, orchestrator_instance):
         """
         Test que verifica list_backups() con directorio vacío.
@@ -70,6 +332,38 @@ class TestBackupOrchestrator:
             assert 'size' in backup
             assert 'modified' in backup
             assert 'path' in backup
+            assert backup['path'] == temp_backup_dir / backup['name']
+
+    def test_list_backups_includes_compressed_files(self, orchestrator_instance, temp_backup_dir):
+        """
+        Test que verifica que list_backups() incluye backups comprimidos con gzip.
+        """
+        (temp_backup_dir / "backup_plano.sql").write_text("-- SQL")
+        (temp_backup_dir / "backup_comprimido.sql.gz").write_bytes(b"\x1f\x8b")
+        (temp_backup_dir / "notas.sqlite").write_text("no es un backup")
+        (temp_backup_dir / "carpeta.sql").mkdir()
+
+        backup_names = {backup['name'] for backup in orchestrator_instance.list_backups()}
+
+        assert backup_names == {"backup_plano.sql", "backup_comprimido.sql.gz"}
+
+    @pytest.mark.parametrize("compress,extension", [
+        (True, ".sql.gz"),
+        (False, ".sql"),
+    ])
+    def test_compression_setting(self, temp_backup_dir, compress, extension):
+        """
+        Test parametrizado que verifica la compresión gzip de pg_dump.
+        """
+        orchestrator = BackupOrchestrator(
+            backup_dir=str(temp_backup_dir),
+            show_progress=False,
+            use_colors=False,
+            compress=compress
+        )
+
+        assert orchestrator.backup_extension == extension
+        assert ("-Z" in orchestrator._pg_dump_cmd) is compress
 
     def test_list_backups_sorted_by_modified_date(self, orchestrator_instance, temp_backup_dir):
         """
@@ -94,6 +388,39 @@ class TestBackupOrchestrator:
         assert backups[0]['name'] == "backup_new.sql"
         assert backups[1]['name'] == "backup_old.sql"
 
+    def test_growth_reporter_updates_only_when_file_grows(self, temp_backup_dir):
+        """
+        Test que verifica que el progreso avanza solo cuando el archivo crece.
+        """
+        progress = Mock()
+
+        with open(temp_backup_dir / "growing.sql", 'wb', buffering=0) as f:
+            report = BackupOrchestrator._growth_reporter(f.fileno(), progress)
+            report()
+            f.write(b"-- dump")
+            report()
+            report()
+
+        progress.update.assert_called_once_with(".")
+
+    def test_growth_reporter_throttles_dots(self, temp_backup_dir):
+        """
+        Test que verifica que los puntos se espacian en el tiempo y tienen un máximo.
+        """
+        progress = Mock()
+
+        with open(temp_backup_dir / "growing.sql", 'wb', buffering=0) as f, \
+             patch('backup_orchestrator.time.monotonic') as mock_clock:
+            report = BackupOrchestrator._growth_reporter(f.fileno(), progress,
+                                                         min_interval=1.0, max_dots=3)
+            for second in (0.0, 0.5, 1.0, 2.0, 3.0, 4.0):
+                mock_clock.return_value = second
+                f.write(b"-- dump")
+                report()
+
+        # 0.5 queda dentro del intervalo y a partir del tercer punto se deja de avanzar
+        assert progress.update.call_count == 3
+
     @patch('backup_orchestrator.BackupOrchestrator._check_docker_container')
     def test_create_backup_container_not_found(self, mock_check_container, orchestrator_instance):
         """
@@ -110,16 +437,17 @@ class TestBackupOrchestrator:
         mock_check_container.assert_called_once()
 
     @patch('backup_orchestrator.BackupOrchestrator._check_docker_container')
-    @patch('subprocess.run')
-    @patch('builtins.open', new_callable=mock_open)
-    def test_create_backup_success(self, mock_file, mock_subprocess, mock_check_container, 
+    @patch('backup_orchestrator.wait_for_process', return_value=b"")
+    @patch('subprocess.Popen')
+    @patch('backup_orchestrator.open', new_callable=mock_open, create=True)
+    def test_create_backup_success(self, mock_file, mock_subprocess, mock_wait, mock_check_container,
                                   orchestrator_instance, temp_backup_dir):
         """
         Test que verifica create_backup() exitoso.
         """
         # Configurar mocks
         mock_check_container.return_value = True
-        mock_subprocess.return_value = Mock(returncode=0, stderr="")
+        mock_subprocess.return_value = Mock(returncode=0)
         
         # Mock del archivo de backup creado
         backup_file = temp_backup_dir / "backup_test.sql"
@@ -135,6 +463,13 @@ class TestBackupOrchestrator:
             assert result is True
             mock_check_container.assert_called_once()
             mock_subprocess.assert_called_once()
+            mock_wait.assert_called_once_with(mock_subprocess.return_value, timeout=300, on_tick=None,
+                                              tick_interval=BackupOrchestrator.PROGRESS_TICK_INTERVAL)
+
+            # El registro llega al archivo de log aunque open esté simulado en el orquestador
+            flush_logs()
+            log_text = (temp_backup_dir / "backup_orchestrator.log").read_text(encoding='utf-8')
+            assert "Backup completado exitosamente: backup_test.sql" in log_text
             
             # Verificar que se llamó con los argumentos correctos
             call_args = mock_subprocess.call_args
@@ -142,22 +477,24 @@ class TestBackupOrchestrator:
             assert "exec" in call_args[0][0]
             assert "test_db" in call_args[0][0]
             assert "pg_dump" in call_args[0][0]
+            assert call_args[0][0] is orchestrator_instance._pg_dump_cmd
 
     @patch('backup_orchestrator.BackupOrchestrator._check_docker_container')
-    @patch('subprocess.run')
-    def test_create_backup_pg_dump_failure(self, mock_subprocess, mock_check_container, 
+    @patch('backup_orchestrator.wait_for_process', return_value=b"Error en pg_dump")
+    @patch('subprocess.Popen')
+    def test_create_backup_pg_dump_failure(self, mock_subprocess, mock_wait, mock_check_container,
                                           orchestrator_instance):
         """
         Test que verifica create_backup() cuando pg_dump falla.
         """
         # Configurar mocks
         mock_check_container.return_value = True
-        mock_subprocess.return_value = Mock(returncode=1, stderr="Error en pg_dump")
+        mock_subprocess.return_value = Mock(returncode=1)
         
         with patch('backup_cli.utils.validator.BackupNameValidator.resolve_backup_filename') as mock_resolve:
             mock_resolve.return_value = ("backup_failed.sql", False)
             
-            with patch('builtins.open', new_callable=mock_open):
+            with patch('backup_orchestrator.open', new_callable=mock_open, create=True):
                 # Ejecutar create_backup
                 result = orchestrator_instance.create_backup()
                 
@@ -166,23 +503,40 @@ class TestBackupOrchestrator:
                 mock_check_container.assert_called_once()
                 mock_subprocess.assert_called_once()
 
+    @patch('backup_orchestrator.BackupOrchestrator._check_docker_container', return_value=True)
+    @patch('backup_orchestrator.wait_for_process', return_value=b"Error en pg_dump")
+    @patch('subprocess.Popen')
+    def test_create_backup_failure_removes_partial_file(self, mock_subprocess, mock_wait,
+                                                        mock_check_container, orchestrator_instance,
+                                                        temp_backup_dir):
+        """
+        Test que verifica que un backup fallido no deja archivos parciales.
+        """
+        mock_subprocess.return_value = Mock(returncode=1)
+
+        result = orchestrator_instance.create_backup(custom_name="parcial")
+
+        assert result is False
+        assert not (temp_backup_dir / "parcial.sql.gz").exists()
+
     @patch('backup_orchestrator.BackupOrchestrator._check_docker_container')
-    @patch('subprocess.run')
-    def test_create_backup_timeout(self, mock_subprocess, mock_check_container, 
+    @patch('backup_orchestrator.wait_for_process')
+    @patch('subprocess.Popen')
+    def test_create_backup_timeout(self, mock_subprocess, mock_wait, mock_check_container,
                                   orchestrator_instance):
         """
         Test que verifica create_backup() cuando hay timeout.
         """
         # Configurar mocks
         mock_check_container.return_value = True
-        mock_subprocess.side_effect = subprocess.TimeoutExpired(
+        mock_wait.side_effect = subprocess.TimeoutExpired(
             cmd=['pg_dump'], timeout=300
         )
         
         with patch('backup_cli.utils.validator.BackupNameValidator.resolve_backup_filename') as mock_resolve:
             mock_resolve.return_value = ("backup_timeout.sql", False)
             
-            with patch('builtins.open', new_callable=mock_open):
+            with patch('backup_orchestrator.open', new_callable=mock_open, create=True):
                 # Ejecutar create_backup
                 result = orchestrator_instance.create_backup()
                 
@@ -197,19 +551,117 @@ class TestBackupOrchestrator:
         # Configurar mocks
         mock_check_container.return_value = True
         
-        with patch('subprocess.run') as mock_subprocess:
+        with patch('subprocess.Popen') as mock_subprocess:
             mock_subprocess.side_effect = FileNotFoundError("docker command not found")
             
             with patch('backup_cli.utils.validator.BackupNameValidator.resolve_backup_filename') as mock_resolve:
                 mock_resolve.return_value = ("backup_no_docker.sql", False)
                 
-                with patch('builtins.open', new_callable=mock_open):
+                with patch('backup_orchestrator.open', new_callable=mock_open, create=True):
                     # Ejecutar create_backup
                     result = orchestrator_instance.create_backup()
                     
                     # Verificaciones
                     assert result is False
 
+    def test_create_backup_docker_not_found_removes_empty_file(self, orchestrator_instance,
+                                                               temp_backup_dir):
+        """
+        Test que verifica que no queda un archivo vacío si falta el comando docker.
+        """
+        with patch.object(BackupOrchestrator, '_check_docker_container', return_value=True), \
+             patch('subprocess.Popen', side_effect=FileNotFoundError("docker")):
+            assert orchestrator_instance.create_backup(custom_name="sin_docker") is False
+
+        assert list(temp_backup_dir.glob("sin_docker*")) == []
+
+    @pytest.mark.skipif(not hasattr(os, 'posix_fadvise'), reason="posix_fadvise no disponible")
+    def test_release_page_cache_after_write(self, temp_backup_dir):
+        """
+        Test que verifica que se sincroniza y descarta la caché del backup escrito.
+        """
+        backup_file = temp_backup_dir / "cache.sql"
+        backup_file.write_bytes(b"SELECT 1;")
+
+        with patch('backup_orchestrator.os.fdatasync') as mock_sync, \
+             patch('backup_orchestrator.os.posix_fadvise') as mock_fadvise:
+            BackupOrchestrator._release_page_cache(backup_file)
+
+        mock_sync.assert_called_once()
+        fd = mock_sync.call_args[0][0]
+        mock_fadvise.assert_called_once_with(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+
+        # Un archivo inexistente se ignora sin error
+        BackupOrchestrator._release_page_cache(temp_backup_dir / "no_existe.sql")
+
+    def test_failed_backup_never_writes_into_existing_inode(self, temp_backup_dir):
+        """
+        Test que verifica que un backup fallido con un nombre ya existente
+        no modifica los archivos que comparten su inodo.
+        """
+        orchestrator = BackupOrchestrator(
+            backup_dir=str(temp_backup_dir),
+            show_progress=False,
+            use_colors=False,
+            compress=False
+        )
+        keep = temp_backup_dir / "keep.sql"
+        keep.write_text("SELECT 1;")
+        # Backup con timestamp que comparte inodo con keep.sql
+        os.link(keep, temp_backup_dir / "backup_20240115_143000.sql")
+        orchestrator._pg_dump_cmd = ("sh", "-c", "printf partial; exit 1")
+
+        with patch.object(BackupOrchestrator, '_check_docker_container', return_value=True), \
+             patch('backup_cli.utils.validator.backup_timestamp', return_value="20240115_143000"):
+            assert orchestrator.create_backup() is False
+
+        assert keep.read_text() == "SELECT 1;"
+        assert (temp_backup_dir / "backup_20240115_143000.sql").read_text() == "SELECT 1;"
+        assert list(temp_backup_dir.glob(".*.tmp")) == []
+
+    def test_successful_backup_replaces_name_without_touching_links(self, temp_backup_dir):
+        """
+        Test que verifica que sobrescribir un nombre enlazado deja intactos los demás enlaces.
+        """
+        orchestrator = BackupOrchestrator(
+            backup_dir=str(temp_backup_dir),
+            show_progress=False,
+            use_colors=False,
+            compress=False
+        )
+        keep = temp_backup_dir / "keep.sql"
+        keep.write_text("SELECT 1;")
+        os.link(keep, temp_backup_dir / "nocturno.sql")
+        orchestrator._pg_dump_cmd = ("sh", "-c", "printf 'SELECT 2;'")
+
+        with patch.object(BackupOrchestrator, '_check_docker_container', return_value=True):
+            assert orchestrator.create_backup(custom_name="nocturno", force_overwrite=True) is True
+
+        assert keep.read_text() == "SELECT 1;"
+        assert (temp_backup_dir / "nocturno.sql").read_text() == "SELECT 2;"
+        assert list(temp_backup_dir.glob(".*.tmp")) == []
+
+    def test_list_backups_cached_until_directory_changes(self, orchestrator_instance, temp_backup_dir):
+        """
+        Test que verifica que el listado se reutiliza mientras el directorio no cambia.
+        """
+        (temp_backup_dir / "backup_a.sql").write_text("-- a")
+        first = orchestrator_instance.list_backups()
+
+        with patch('backup_orchestrator.os.scandir') as mock_scandir:
+            assert orchestrator_instance.list_backups() == first
+            mock_scandir.assert_not_called()
+
+        # Un archivo nuevo cambia el mtime del directorio
+        os.utime(temp_backup_dir, ns=(0, 1))
+        (temp_backup_dir / "backup_b.sql").write_text("-- b")
+        assert len(orchestrator_instance.list_backups()) == 2
+
+        # Tras un backup se descarta la caché aunque el directorio no cambie
+        with patch.object(BackupOrchestrator, '_check_docker_container', return_value=False):
+            orchestrator_instance.create_backup()
+        assert orchestrator_instance._backup_cache is None
+
     def test_create_backup_invalid_custom_name(self, orchestrator_instance):
         """
         Test que verifica create_backup() con nombre personalizado inválido.
@@ -236,13 +688,14 @@ class TestBackupOrchestrator:
         with patch('backup_orchestrator.BackupOrchestrator._check_docker_container') as mock_check:
             mock_check.return_value = True
             
-            with patch('subprocess.run') as mock_subprocess:
-                mock_subprocess.return_value = Mock(returncode=0, stderr="")
+            with patch('subprocess.Popen') as mock_subprocess, \
+                 patch('backup_orchestrator.wait_for_process', return_value=b""):
+                mock_subprocess.return_value = Mock(returncode=0)
                 
                 with patch('backup_cli.utils.validator.BackupNameValidator.resolve_backup_filename') as mock_resolve:
                     mock_resolve.return_value = (expected_name, False)
                     
-                    with patch('builtins.open', new_callable=mock_open):
+                    with patch('backup_orchestrator.open', new_callable=mock_open, create=True):
                         # Simular archivo creado
                         with patch.object(Path, 'stat') as mock_stat:
                             mock_stat.return_value.st_size = 1024
@@ -258,5 +711,132 @@ class TestBackupOrchestrator:
                             mock_resolve.assert_called_once_with(
                                 orchestrator_instance.backup_dir,
                                 custom_name,
-                                force_overwrite
-                            ) 
\ No newline at end of file
+                                force_overwrite,
+                                ".sql.gz"
+                            )
+
+
+class TestDisplayBackupList:
+    """
+    Clase de tests para el listado de backups por consola.
+    """
+
+    def test_display_backup_list_empty(self, orchestrator_instance, capsys):
+        """
+        Test que verifica el mensaje cuando no hay backups.
+        """
+        assert display_backup_list(orchestrator_instance, use_colors=False) == 0
+        assert capsys.readouterr().out == "No se encontraron archivos de backup\n"
+
+    def test_display_backup_list_single_write(self, orchestrator_instance, temp_backup_dir):
+        """
+        Test que verifica que el listado completo se emite en una sola escritura.
+        """
+        (temp_backup_dir / "backup_a.sql").write_text("-- a")
+        (temp_backup_dir / "backup_b.sql.gz").write_bytes(b"\x1f\x8b")
+
+        with patch('sys.stdout') as mock_stdout:
+            assert display_backup_list(orchestrator_instance, use_colors=False) == 0
+
+        mock_stdout.write.assert_called_once()
+        output = mock_stdout.write.call_args[0][0]
+        lines = output.splitlines()
+        assert lines[0] == f"Archivos de backup en {temp_backup_dir}:"
+        assert lines[1] == "-" * 60
+        assert len(lines) == 4
+        assert any(line.startswith("backup_a.sql") and "4.0 B" in line for line in lines)
+        assert any(line.startswith("backup_b.sql.gz") for line in lines)
+        assert output.endswith("\n")
+
+    def test_display_backup_list_colored_rows(self, temp_backup_dir, capsys):
+        """
+        Test que verifica que las filas con color contienen los mismos datos que sin color.
+        """
+        # Con use_colors=False el orquestador deshabilitaría los códigos ANSI globales
+        orchestrator = BackupOrchestrator(
+            backup_dir=str(temp_backup_dir),
+            show_progress=False,
+            use_colors=True
+        )
+        (temp_backup_dir / "backup_a.sql").write_text("-- a")
+
+        display_backup_list(orchestrator, use_colors=True)
+        colored = capsys.readouterr().out
+        display_backup_list(orchestrator, use_colors=False)
+        plain = capsys.readouterr().out
+
+        row = plain.splitlines()[2]
+        assert row.startswith("backup_a.sql".ljust(30))
+        assert "4.0 B".rjust(10) in row
+        assert "\033[" not in plain
+        assert f"\033[37m{'backup_a.sql':<30}\033[0m" in colored
+        assert colored.splitlines()[2] != row
+
+    def test_display_backup_list_limit(self, orchestrator_instance, temp_backup_dir, capsys):
+        """
+        Test que verifica que --limit muestra solo los backups más recientes.
+        """
+        for i in range(3):
+            backup_file = temp_backup_dir / f"backup_{i}.sql"
+            backup_file.write_text("--")
+            os.utime(backup_file, (1_700_000_000 + i, 1_700_000_000 + i))
+
+        assert display_backup_list(orchestrator_instance, use_colors=False, limit=2) == 0
+
+        rows = capsys.readouterr().out.splitlines()[2:]
+        assert [row.split()[0] for row in rows] == ["backup_2.sql", "backup_1.sql"]
+        assert len(orchestrator_instance.list_backups()) == 3
+
+    @pytest.mark.parametrize("limit", [0, -1])
+    def test_list_backups_rejects_non_positive_limit(self, orchestrator_instance, limit):
+        """
+        Test parametrizado que verifica que un límite no positivo se rechaza.
+        """
+        with pytest.raises(ValueError):
+            orchestrator_instance.list_backups(limit)
+
+
+class TestConcurrentBackups:
+    """
+    Clase de tests para los backups de varios contenedores en paralelo.
+    """
+
+    def test_backup_containers_concurrently(self, temp_backup_dir):
+        """
+        Test que verifica un backup por contenedor con nombres que no colisionan.
+        """
+        calls = {}
+
+        def fake_create_backup(self, custom_name=None, force_overwrite=False):
+            calls[self.container_name] = (custom_name, force_overwrite, self.show_progress)
+            return self.container_name != "db_caida"
+
+        with patch.object(BackupOrchestrator, 'create_backup', fake_create_backup):
+            results = backup_containers_concurrently(
+                ["db1", "db_caida"],
+                {"backup_dir": str(temp_backup_dir), "use_colors": False},
+                custom_name="nocturno",
+                force_overwrite=True
+            )
+
+        assert results == {"db1": True, "db_caida": False}
+        assert calls["db1"] == ("nocturno_db1", True, False)
+        assert calls["db_caida"] == ("nocturno_db_caida", True, False)
+
+    def test_backup_containers_concurrently_timestamped_names(self, temp_backup_dir):
+        """
+        Test que verifica los nombres con timestamp cuando no se indica nombre.
+        """
+        names = []
+
+        def fake_create_backup(self, custom_name=None, force_overwrite=False):
+            names.append(custom_name)
+            return True
+
+        with patch.object(BackupOrchestrator, 'create_backup', fake_create_backup), \
+             patch('backup_orchestrator.backup_timestamp', return_value="20240115_143000"):
+            backup_containers_concurrently(
+                ["db1", "db2"], {"backup_dir": str(temp_backup_dir), "use_colors": False}
+            )
+
+        assert sorted(names) == ["backup_db1_20240115_143000", "backup_db2_20240115_143000"]
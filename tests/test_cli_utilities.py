@@ -3,12 +3,16 @@ Tests unitarios para las utilidades CLI del proyecto.
 """
 
 import pytest
+import subprocess
 import sys
 from io import StringIO
 from unittest.mock import patch, Mock
-from backup_cli.utils.colors import Colors, should_use_colors, print_colored_message
-from backup_cli.utils.progress import ProgressIndicator
-from backup_cli.cli.parser import create_cli_parser, CLIConfig
+from backup_cli.utils.colors import (
+    Colors, should_use_colors, print_colored_message, build_level_prefixes
+)
+from backup_cli.utils.progress import ProgressIndicator, NullProgressIndicator, NULL_PROGRESS
+from backup_cli.utils.process import wait_for_process
+from backup_cli.cli.parser import create_cli_parser, validate_cli_args, CLIConfig
 
 
 class TestColors:
@@ -52,6 +56,16 @@ class TestColors:
         Colors.GREEN = original_green
         Colors.RESET = original_reset
 
+    def test_colors_disable_covers_all_color_attributes(self):
+        """
+        Test que verifica que _COLOR_ATTRS incluye todos los códigos ANSI de la clase.
+        """
+        color_attrs = {
+            name for name, value in vars(Colors).items()
+            if name.isupper() and isinstance(value, str)
+        }
+        assert color_attrs == set(Colors._COLOR_ATTRS)
+
     @pytest.mark.parametrize("no_color_flag,isatty_result,expected", [
         (False, True, True),   # Terminal TTY sin flag no_color
         (True, True, False),   # Terminal TTY con flag no_color
@@ -78,8 +92,8 @@ class TestColors:
             call_args = mock_print.call_args[0][0]
             assert '[INFO]' in call_args
             assert 'Test message' in call_args
-            assert Colors.BLUE in call_args  # INFO usa color azul
-            assert Colors.RESET in call_args
+            assert '\033[34m' in call_args  # INFO usa color azul
+            assert '\033[0m' in call_args
 
     def test_print_colored_message_without_colors(self):
         """
@@ -108,6 +122,41 @@ class TestColors:
             assert 'Test message' in call_args
 
 
+    def test_build_level_prefixes_matches_printed_prefix(self):
+        """
+        Test que verifica que los prefijos precalculados coinciden con los impresos.
+        """
+        prefixes = build_level_prefixes(use_colors=False)
+
+        assert prefixes['ERROR'] == '[ERROR]'
+        assert set(prefixes) == {'INFO', 'SUCCESS', 'WARNING', 'ERROR', 'FAILED', 'CANCELLED'}
+        with patch('builtins.print') as mock_print:
+            print_colored_message('WARNING', 'Aviso', use_colors=False)
+            mock_print.assert_called_once_with(f"{prefixes['WARNING']} Aviso")
+
+
+    def test_print_colored_message_keeps_percent_signs(self):
+        """
+        Test que verifica que las plantillas no interpretan '%' del mensaje.
+        """
+        with patch('builtins.print') as mock_print:
+            print_colored_message('INFO', 'Progreso 100% (%s)', use_colors=False)
+
+            mock_print.assert_called_once_with('[INFO] Progreso 100% (%s)')
+
+
+    def test_print_colored_message_after_disable(self):
+        """
+        Test que verifica que deshabilitar colores actualiza las plantillas precalculadas.
+        """
+        Colors.disable()
+
+        with patch('builtins.print') as mock_print:
+            print_colored_message('ERROR', 'Fallo', use_colors=True)
+
+            mock_print.assert_called_once_with('[ERROR] Fallo')
+
+
 class TestProgressIndicator:
     """
     Clase de tests para el indicador de progreso.
@@ -214,6 +263,93 @@ class TestProgressIndicator:
                 assert mock_print.call_count == 3
 
 
+class TestNullProgressIndicator:
+    """
+    Clase de tests para el indicador de progreso nulo.
+    """
+
+    def test_null_progress_produces_no_output(self):
+        """
+        Test que verifica que el indicador nulo no imprime ni espera.
+        """
+        with patch('builtins.print') as mock_print, patch('time.sleep') as mock_sleep:
+            NULL_PROGRESS.start()
+            NULL_PROGRESS.update(".")
+            NULL_PROGRESS.simulate_work()
+            NULL_PROGRESS.complete(False)
+
+            mock_print.assert_not_called()
+            mock_sleep.assert_not_called()
+
+        assert isinstance(NULL_PROGRESS, NullProgressIndicator)
+        assert NULL_PROGRESS.active is False
+
+
+class TestWaitForProcess:
+    """
+    Clase de tests para la espera de subprocesos.
+    """
+
+    def test_wait_for_process_collects_stderr(self):
+        """
+        Test que verifica que se drena el stderr y se obtiene el código de salida.
+        """
+        proc = subprocess.Popen(
+            [sys.executable, "-c", "import sys; sys.stderr.write('fallo'); sys.exit(3)"],
+            stderr=subprocess.PIPE
+        )
+
+        stderr = wait_for_process(proc, timeout=10)
+
+        assert stderr == b"fallo"
+        assert proc.returncode == 3
+
+    def test_wait_for_process_calls_on_tick_while_running(self):
+        """
+        Test que verifica que on_tick se invoca mientras el proceso sigue activo.
+        """
+        proc = subprocess.Popen(
+            [sys.executable, "-c", "import time; time.sleep(0.3)"],
+            stderr=subprocess.PIPE
+        )
+        on_tick = Mock()
+
+        wait_for_process(proc, timeout=10, on_tick=on_tick, tick_interval=0.05)
+
+        assert on_tick.call_count >= 1
+        assert proc.returncode == 0
+
+    def test_wait_for_process_without_pidfd_support(self):
+        """
+        Test que verifica el uso de communicate() cuando el kernel rechaza pidfd_open.
+        """
+        proc = subprocess.Popen(
+            [sys.executable, "-c", "import sys; sys.stderr.write('fallo'); sys.exit(3)"],
+            stderr=subprocess.PIPE
+        )
+
+        with patch('backup_cli.utils.process.os.pidfd_open', create=True,
+                   side_effect=OSError(38, "Function not implemented")):
+            stderr = wait_for_process(proc, timeout=10)
+
+        assert stderr == b"fallo"
+        assert proc.returncode == 3
+
+    def test_wait_for_process_timeout_kills_process(self):
+        """
+        Test que verifica que se termina el proceso al exceder el tiempo límite.
+        """
+        proc = subprocess.Popen(
+            [sys.executable, "-c", "import time; time.sleep(30)"],
+            stderr=subprocess.PIPE
+        )
+
+        with pytest.raises(subprocess.TimeoutExpired):
+            wait_for_process(proc, timeout=0.2)
+
+        assert proc.returncode is not None
+
+
 class TestCLIParser:
     """
     Clase de tests para el parser CLI.
@@ -237,7 +373,13 @@ class TestCLIParser:
         args = parser.parse_args([])  # Sin argumentos
         
         assert args.name is None
-        assert args.container == 'pc_db'
+        assert args.container == ['pc_db']
+        assert args.db_host is None
+        assert args.db_port == 5432
+        assert args.format == 'plain'
+        assert args.no_compress is False
+        assert args.jobs == 1
+        assert args.limit is None
         assert args.dir == 'backups'
         assert args.verbose is False
         assert args.quiet is False
@@ -253,23 +395,75 @@ class TestCLIParser:
         args = parser.parse_args([
             '--name', 'test_backup',
             '--container', 'my_db',
+            '--db-host', '127.0.0.1',
+            '--db-port', '5433',
+            '--format', 'custom',
+            '--no-compress',
+            '--jobs', '4',
             '--dir', '/tmp/backups',
             '--verbose',
             '--quiet',
             '--force',
             '--list',
+            '--limit', '5',
             '--no-color'
         ])
         
         assert args.name == 'test_backup'
-        assert args.container == 'my_db'
+        assert args.container == ['my_db']
+        assert args.db_host == '127.0.0.1'
+        assert args.db_port == 5433
+        assert args.format == 'custom'
+        assert args.no_compress is True
+        assert args.jobs == 4
         assert args.dir == '/tmp/backups'
         assert args.verbose is True
         assert args.quiet is True
         assert args.force is True
         assert args.list is True
+        assert args.limit == 5
         assert args.no_color is True
 
+    @pytest.mark.parametrize("limit", ["0", "-1", "diez"])
+    def test_cli_parser_rejects_non_positive_limit(self, limit):
+        """
+        Test parametrizado que verifica que --limit exige un entero positivo.
+        """
+        parser = create_cli_parser()
+
+        with pytest.raises(SystemExit):
+            parser.parse_args(['--list', '--limit', limit])
+
+    def test_limit_requires_list(self):
+        """
+        Test que verifica que --limit sin --list se rechaza.
+        """
+        parser = create_cli_parser()
+        validate_cli_args(parser, parser.parse_args(['--list', '--limit', '3']))
+
+        with pytest.raises(SystemExit):
+            validate_cli_args(parser, parser.parse_args(['--limit', '3']))
+
+    @pytest.mark.parametrize("jobs", ["0", "-3"])
+    def test_cli_parser_rejects_non_positive_jobs(self, jobs):
+        """
+        Test parametrizado que verifica que --jobs exige un entero positivo.
+        """
+        parser = create_cli_parser()
+
+        with pytest.raises(SystemExit):
+            parser.parse_args(['--jobs', jobs])
+
+    def test_parallel_jobs_conflict_with_custom_format(self):
+        """
+        Test que verifica que --jobs no cambia en silencio el formato custom pedido.
+        """
+        parser = create_cli_parser()
+        validate_cli_args(parser, parser.parse_args(['--format', 'directory', '--jobs', '4']))
+
+        with pytest.raises(SystemExit):
+            validate_cli_args(parser, parser.parse_args(['--format', 'custom', '--jobs', '4']))
+
     def test_cli_parser_short_arguments(self):
         """
         Test que verifica los argumentos cortos del parser.
@@ -286,7 +480,7 @@ class TestCLIParser:
         ])
         
         assert args.name == 'backup_short'
-        assert args.container == 'container_short'
+        assert args.container == ['container_short']
         assert args.dir == 'dir_short'
         assert args.verbose is True
         assert args.quiet is True
@@ -306,7 +500,12 @@ class TestCLIConfig:
         # Crear mock args
         mock_args = Mock()
         mock_args.name = 'test'
-        mock_args.container = 'test_db'
+        mock_args.container = ['test_db', 'otra_db', 'test_db']
+        mock_args.db_host = 'localhost'
+        mock_args.db_port = 5432
+        mock_args.format = 'custom'
+        mock_args.no_compress = True
+        mock_args.jobs = 4
         mock_args.dir = 'test_dir'
         mock_args.verbose = True
         mock_args.quiet = False
@@ -318,6 +517,12 @@ class TestCLIConfig:
         
         assert config.name == 'test'
         assert config.container == 'test_db'
+        assert config.containers == ['test_db', 'otra_db']
+        assert config.db_host == 'localhost'
+        assert config.db_port == 5432
+        assert config.dump_format == 'custom'
+        assert config.compress is False
+        assert config.jobs == 4
         assert config.backup_dir == 'test_dir'
         assert config.verbose is True
         assert config.quiet is False
@@ -3,9 +3,15 @@ Tests unitarios para la funcionalidad de conexión a Docker del BackupOrchestrat
 """
 
 import pytest
+import socketserver
 import subprocess
+import threading
+from http.server import BaseHTTPRequestHandler
 from unittest.mock import patch, Mock
 from backup_orchestrator import BackupOrchestrator
+from backup_cli.utils.docker_api import (
+    DockerEngineClient, DockerAPIUnavailable, DOCKER_SOCKET, resolve_docker_socket
+)
 
 
 class TestDockerConnection:
@@ -18,7 +24,7 @@ class TestDockerConnection:
         Test que verifica que _check_docker_container() retorna True cuando el contenedor existe.
         """
         # Configurar el mock para simular contenedor existente
-        mock_docker_container.return_value = Mock(returncode=0)
+        mock_docker_container.return_value = Mock(returncode=0, stdout="true\n")
         
         # Ejecutar la verificación
         result = orchestrator_instance._check_docker_container()
@@ -26,7 +32,7 @@ class TestDockerConnection:
         # Verificaciones
         assert result is True
         mock_docker_container.assert_called_once_with(
-            ["docker", "inspect", "test_db"],
+            ["docker", "inspect", "--format", "{{.State.Running}}", "test_db"],
             capture_output=True,
             text=True,
             timeout=10
@@ -37,7 +43,7 @@ class TestDockerConnection:
         Test que verifica que _check_docker_container() retorna False cuando el contenedor no existe.
         """
         # Configurar el mock para simular contenedor no encontrado
-        mock_docker_container_not_found.return_value = Mock(returncode=1)
+        mock_docker_container_not_found.return_value = Mock(returncode=1, stdout="")
         
         # Ejecutar la verificación
         result = orchestrator_instance._check_docker_container()
@@ -45,13 +51,21 @@ class TestDockerConnection:
         # Verificaciones
         assert result is False
         mock_docker_container_not_found.assert_called_once_with(
-            ["docker", "inspect", "test_db"],
+            ["docker", "inspect", "--format", "{{.State.Running}}", "test_db"],
             capture_output=True,
             text=True,
             timeout=10
         )
 
-    def test_check_docker_container_timeout(self, orchestrator_instance):
+    def test_check_docker_container_stopped(self, orchestrator_instance, mock_docker_container):
+        """
+        Test que verifica que un contenedor detenido no se considera disponible.
+        """
+        mock_docker_container.return_value = Mock(returncode=0, stdout="false\n")
+
+        assert orchestrator_instance._check_docker_container() is False
+
+    def test_check_docker_container_timeout(self, orchestrator_instance, docker_api_unavailable):
         """
         Test que verifica el manejo de timeout en la verificación del contenedor.
         """
@@ -68,7 +82,7 @@ class TestDockerConnection:
             # Verificaciones
             assert result is False
 
-    def test_check_docker_container_docker_not_found(self, orchestrator_instance):
+    def test_check_docker_container_docker_not_found(self, orchestrator_instance, docker_api_unavailable):
         """
         Test que verifica el manejo cuando Docker no está instalado.
         """
@@ -87,7 +101,8 @@ class TestDockerConnection:
         ("mysql_container", "mysql_container"),
         ("custom-db-123", "custom-db-123"),
     ])
-    def test_check_docker_container_different_names(self, temp_backup_dir, container_name, expected_call):
+    def test_check_docker_container_different_names(self, temp_backup_dir, container_name, expected_call,
+                                                    docker_api_unavailable):
         """
         Test parametrizado para verificar diferentes nombres de contenedores.
         """
@@ -100,7 +115,7 @@ class TestDockerConnection:
         )
         
         with patch('subprocess.run') as mock_run:
-            mock_run.return_value = Mock(returncode=0)
+            mock_run.return_value = Mock(returncode=0, stdout="true\n")
             
             # Ejecutar la verificación
             result = orchestrator._check_docker_container()
@@ -108,8 +123,179 @@ class TestDockerConnection:
             # Verificaciones
             assert result is True
             mock_run.assert_called_once_with(
-                ["docker", "inspect", expected_call],
+                ["docker", "inspect", "--format", "{{.State.Running}}", expected_call],
                 capture_output=True,
                 text=True,
                 timeout=10
-            ) 
\ No newline at end of file
+            )
+
+    @pytest.mark.parametrize("running", [True, False])
+    def test_check_docker_container_uses_engine_api(self, orchestrator_instance, running):
+        """
+        Test que verifica que se consulta la API de Docker sin lanzar el CLI.
+        """
+        with patch('backup_cli.utils.docker_api.DockerEngineClient.container_running') as mock_api, \
+             patch('subprocess.run') as mock_run:
+            mock_api.return_value = running
+
+            result = orchestrator_instance._check_docker_container()
+
+            assert result is running
+            mock_api.assert_called_once_with("test_db")
+            mock_run.assert_not_called()
+
+    def test_check_docker_container_caches_positive_result(self, orchestrator_instance):
+        """
+        Test que verifica que una verificación positiva se reutiliza durante el TTL.
+        """
+        with patch('backup_cli.utils.docker_api.DockerEngineClient.container_running', return_value=True) as mock_api, \
+             patch('backup_orchestrator.time.monotonic') as mock_clock:
+            mock_clock.return_value = 100.0
+            assert orchestrator_instance._check_docker_container() is True
+            assert orchestrator_instance._check_docker_container() is True
+            assert mock_api.call_count == 1
+
+            # Expirado el TTL se vuelve a consultar al daemon
+            mock_clock.return_value = 100.0 + BackupOrchestrator.CONTAINER_CHECK_TTL + 1
+            assert orchestrator_instance._check_docker_container() is True
+            assert mock_api.call_count == 2
+
+    def test_check_docker_container_does_not_cache_negative_result(self, orchestrator_instance):
+        """
+        Test que verifica que un contenedor no disponible se vuelve a consultar.
+        """
+        with patch('backup_cli.utils.docker_api.DockerEngineClient.container_running', return_value=False) as mock_api:
+            assert orchestrator_instance._check_docker_container() is False
+            assert orchestrator_instance._check_docker_container() is False
+            assert mock_api.call_count == 2
+
+
+class _FakeDockerHandler(BaseHTTPRequestHandler):
+    """
+    Handler que imita la respuesta de /containers/{name}/json del daemon.
+    """
+    protocol_version = "HTTP/1.1"
+    containers = {"pc_db": b'{"State": {"Running": true}}', "detenido": b'{"State": {"Running": false}}'}
+
+    def do_GET(self):
+        name = self.path.split("/")[2]
+        body = self.containers.get(name, b'{"message": "No such container"}')
+        self.send_response(200 if name in self.containers else 404)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class _CountingUnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+    connections = 0
+
+    def process_request(self, request, client_address):
+        self.connections += 1
+        super().process_request(request, client_address)
+
+
+@pytest.fixture
+def fake_docker_socket(tmp_path):
+    """
+    Fixture que levanta un daemon de Docker simulado sobre un socket UNIX.
+    """
+    server = _CountingUnixServer(str(tmp_path / "docker.sock"), _FakeDockerHandler)
+    thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+class TestDockerEngineClient:
+    """
+    Clase de tests para el cliente de la API de Docker Engine.
+    """
+
+    @pytest.mark.parametrize("name,expected", [
+        ("pc_db", True),
+        ("detenido", False),
+        ("inexistente", False),
+    ])
+    def test_container_running(self, fake_docker_socket, name, expected):
+        """
+        Test parametrizado para contenedores en ejecución, detenidos e inexistentes.
+        """
+        client = DockerEngineClient(socket_path=fake_docker_socket.server_address)
+
+        assert client.container_running(name) is expected
+        client.close()
+
+    def test_connection_is_reused(self, fake_docker_socket):
+        """
+        Test que verifica que varias consultas comparten una única conexión.
+        """
+        client = DockerEngineClient(socket_path=fake_docker_socket.server_address)
+
+        for _ in range(3):
+            assert client.container_running("pc_db") is True
+        client.close()
+
+        assert fake_docker_socket.connections == 1
+
+    def test_missing_socket_raises_unavailable(self, tmp_path):
+        """
+        Test que verifica el error cuando el socket de Docker no existe.
+        """
+        client = DockerEngineClient(socket_path=str(tmp_path / "no_existe.sock"))
+
+        with pytest.raises(DockerAPIUnavailable):
+            client.container_running("pc_db")
+
+    @pytest.mark.parametrize("env,expected", [
+        ({}, DOCKER_SOCKET),
+        ({"DOCKER_HOST": "unix:///run/user/1000/docker.sock"}, "/run/user/1000/docker.sock"),
+        ({"DOCKER_CONTEXT": "default"}, DOCKER_SOCKET),
+    ])
+    def test_resolve_docker_socket(self, tmp_path, monkeypatch, env, expected):
+        """
+        Test parametrizado que verifica el socket elegido según el entorno de docker.
+        """
+        for var in ("DOCKER_HOST", "DOCKER_CONTEXT"):
+            monkeypatch.delenv(var, raising=False)
+        monkeypatch.setenv("DOCKER_CONFIG", str(tmp_path))
+        for var, value in env.items():
+            monkeypatch.setenv(var, value)
+
+        assert resolve_docker_socket() == expected
+
+    @pytest.mark.parametrize("env,config", [
+        ({"DOCKER_HOST": "tcp://10.0.0.5:2376"}, None),
+        ({"DOCKER_CONTEXT": "rootless"}, None),
+        ({}, '{"currentContext": "remoto"}'),
+    ])
+    def test_unsupported_docker_target_raises_unavailable(self, tmp_path, monkeypatch, env, config):
+        """
+        Test parametrizado que verifica que un daemon remoto o en otro contexto
+        se delega al CLI de docker.
+        """
+        for var in ("DOCKER_HOST", "DOCKER_CONTEXT"):
+            monkeypatch.delenv(var, raising=False)
+        monkeypatch.setenv("DOCKER_CONFIG", str(tmp_path))
+        for var, value in env.items():
+            monkeypatch.setenv(var, value)
+        if config:
+            (tmp_path / "config.json").write_text(config)
+
+        client = DockerEngineClient()
+        with pytest.raises(DockerAPIUnavailable):
+            client.container_running("pc_db")
+
+    def test_docker_host_unix_socket_is_used(self, fake_docker_socket, monkeypatch):
+        """
+        Test que verifica que se consulta el socket indicado en DOCKER_HOST.
+        """
+        monkeypatch.setenv("DOCKER_HOST", f"unix://{fake_docker_socket.server_address}")
+
+        client = DockerEngineClient()
+        assert client.container_running("pc_db") is True
+        client.close()
@@ -4,10 +4,14 @@ Tests unitarios para la funcionalidad de validación y generación de nombres de
 
 import pytest
 import tempfile
+import time
 from pathlib import Path
 from datetime import datetime
 from unittest.mock import patch
-from backup_cli.utils.validator import BackupNameValidator, format_file_size
+from backup_cli.utils.validator import BackupNameValidator, backup_timestamp, format_file_size
+
+# 2024-01-15 14:30:00 hora local
+FIXED_LOCALTIME = time.struct_time((2024, 1, 15, 14, 30, 0, 0, 15, 0))
 
 
 class TestBackupNameValidator:
@@ -87,9 +91,9 @@ class TestBackupNameValidator:
         with tempfile.TemporaryDirectory() as temp_dir:
             backup_dir = Path(temp_dir)
             
-            # Mock datetime para timestamp predecible
-            with patch('backup_cli.utils.validator.datetime') as mock_datetime:
-                mock_datetime.now.return_value.strftime.return_value = "20240115_143000"
+            # Mock time para timestamp predecible
+            with patch('backup_cli.utils.validator.time') as mock_time:
+                mock_time.localtime.return_value = FIXED_LOCALTIME
                 
                 filename, name_modified = BackupNameValidator.resolve_backup_filename(backup_dir)
                 
@@ -111,6 +115,24 @@ class TestBackupNameValidator:
             assert filename == "mi_backup_test.sql"
             assert name_modified is False
 
+    def test_resolve_backup_filename_custom_extension(self):
+        """
+        Test que verifica el uso de una extensión distinta a .sql.
+        """
+        with tempfile.TemporaryDirectory() as temp_dir:
+            backup_dir = Path(temp_dir)
+            (backup_dir / "comprimido.sql.gz").touch()
+
+            with patch('backup_cli.utils.validator.time') as mock_time:
+                mock_time.localtime.return_value = FIXED_LOCALTIME
+
+                filename, name_modified = BackupNameValidator.resolve_backup_filename(
+                    backup_dir, "comprimido", extension=".sql.gz"
+                )
+
+            assert filename == "comprimido_20240115_143000.sql.gz"
+            assert name_modified is True
+
     def test_resolve_backup_filename_custom_name_with_conflict(self):
         """
         Test que verifica la resolución de conflictos de nombres.
@@ -123,9 +145,9 @@ class TestBackupNameValidator:
             existing_file = backup_dir / f"{custom_name}.sql"
             existing_file.touch()
             
-            # Mock datetime para timestamp predecible
-            with patch('backup_cli.utils.validator.datetime') as mock_datetime:
-                mock_datetime.now.return_value.strftime.return_value = "20240115_143000"
+            # Mock time para timestamp predecible
+            with patch('backup_cli.utils.validator.time') as mock_time:
+                mock_time.localtime.return_value = FIXED_LOCALTIME
                 
                 filename, name_modified = BackupNameValidator.resolve_backup_filename(
                     backup_dir, custom_name, force_overwrite=False
@@ -153,6 +175,31 @@ class TestBackupNameValidator:
             assert filename == "backup_sobrescribir.sql"
             assert name_modified is False
 
+    def test_resolve_backup_filename_force_overwrite_skips_exists(self):
+        """
+        Test que verifica que con sobrescritura forzada no se consulta el disco.
+        """
+        with patch.object(Path, 'exists') as mock_exists:
+            filename, name_modified = BackupNameValidator.resolve_backup_filename(
+                Path("backups"), "backup_forzado", force_overwrite=True
+            )
+
+        assert filename == "backup_forzado.sql"
+        assert name_modified is False
+        mock_exists.assert_not_called()
+
+    @pytest.mark.parametrize("fields", [
+        (2024, 1, 15, 14, 30, 0, 0, 15, 0),
+        (1999, 12, 31, 23, 59, 59, 4, 365, 0),
+        (2030, 7, 4, 0, 5, 9, 3, 185, 1),
+    ])
+    def test_backup_timestamp_matches_strftime(self, fields):
+        """
+        Test parametrizado que verifica que el timestamp coincide con strftime.
+        """
+        now = time.struct_time(fields)
+        assert backup_timestamp(now) == time.strftime(BackupNameValidator.TIMESTAMP_FORMAT, now)
+
     def test_resolve_backup_filename_invalid_custom_name(self):
         """
         Test que verifica el manejo de nombres personalizados inválidos.
@@ -178,6 +225,7 @@ class TestFormatFileSize:
         (1023, "1023.0 B"),
         (1024, "1.0 KB"),
         (1536, "1.5 KB"),
+        (1048575, "1024.0 KB"),
         (1048576, "1.0 MB"),
         (1073741824, "1.0 GB"),
         (1099511627776, "1.0 TB"),